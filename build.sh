@@ -6,3 +6,7 @@ python -m pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+python manage.py createcachetable
+python manage.py reconcile_current_leases
+python manage.py rebuild_analytics_rollup
+python manage.py prune_sessions
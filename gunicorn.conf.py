@@ -0,0 +1,53 @@
+"""
+Gunicorn serving profile for rentre.
+
+SERVER_MODE=asgi (default) runs the async dashboard and detail views natively
+under Uvicorn workers; SERVER_MODE=wsgi falls back to threaded sync workers.
+rentre/settings.py reads the same variable to pick pooled (asgi) or persistent
+(wsgi) PostgreSQL connections.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Chosen from "python manage.py load_test" (16 keep-alive clients cycling the
+# dashboards, analytics, lease details and API, warm cache) against
+# generate_portfolio --landlords 50 --tenants 300 --units-per-landlord 20:200
+# on SQLite, 1 core shared with the clients; two runs, req/s / p95 ms / errors:
+#
+#   asgi  1 worker         78 / 292 / 16    73 / 294 / 16
+#   asgi  2 workers        82 / 355 / 0     67 / 492 / 0
+#   asgi  3 workers        74 / 480 / 0     68 / 536 / 0
+#   wsgi  1 worker  t1     85 / 234 / 1
+#   wsgi  1 worker  t4     81 / 296 / 5
+#   wsgi  1 worker  t8     89 / 357 / 8
+#   wsgi  2 workers t1                      94 / 267 / 1
+#   wsgi  2 workers t4     82 / 476 / 0     97 / 341 / 0
+#   wsgi  2 workers t8                      103 / 298 / 8
+#   wsgi  3 workers t4     84 / 478 / 0
+#
+# Throughput differences are within run-to-run noise: requests are CPU-bound,
+# and workers beyond one per core only stretch p95. A lone worker drops every
+# in-flight request (one per client) each time max_requests recycles it, so
+# never fewer than two. Cached pages are keyed by database revisions, so
+# per-worker locmem caches stay consistent.
+workers = int(os.environ.get('WEB_CONCURRENCY', max(2, multiprocessing.cpu_count())))
+
+if os.environ.get('SERVER_MODE', 'asgi') == 'asgi':
+    wsgi_app = 'rentre.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'rentre.wsgi:application'
+    worker_class = 'gthread'
+    # 1, 4 and 8 threads are within noise above; 8 dropped requests on
+    # recycles. Each thread keeps its own persistent connection (CONN_MAX_AGE)
+    threads = int(os.environ.get('GUNICORN_THREADS', '4'))
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+keepalive = 5
+
+# Recycle workers now and then so a slow leak cannot grow unbounded
+max_requests = 1000
+max_requests_jitter = 100
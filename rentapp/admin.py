@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import User, Landlord, Tenant, Property, Lease, LeaseTenant
+from .models import User, Landlord, Tenant, Property, Lease, LeaseTenant, LandlordAnalyticsRollup
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
@@ -32,3 +32,8 @@ class LeaseAdmin(admin.ModelAdmin):
 class LeaseTenantAdmin(admin.ModelAdmin):
     list_display = ('lease', 'tenant', 'confirmed')
     list_filter = ('confirmed',)
+
+@admin.register(LandlordAnalyticsRollup)
+class LandlordAnalyticsRollupAdmin(admin.ModelAdmin):
+    list_display = ('landlord', 'city', 'state', 'status', 'property_count', 'active_lease_count', 'rent_sum')
+    list_filter = ('status', 'state')
@@ -0,0 +1,169 @@
+import hashlib
+from decimal import Decimal
+from functools import wraps
+
+from django.http import JsonResponse
+from django.views.decorators.http import condition, require_GET
+
+from .cache import cached
+from .models import Property
+from .pagination import after_cursor, get_cursor, get_page_size, page_links, split_page
+from .views import get_lease_details, tenant_dashboard_leases
+
+API_VERSION = 'v1'
+
+
+def api_response(data, status=200):
+    return JsonResponse(data, status=status, json_dumps_params={'separators': (',', ':')})
+
+
+def api_login_required(*roles):
+    """JSON 401 for anonymous callers (no login redirect), 403 for a role the resource does not serve"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            identity = request.identity
+            if not identity.is_authenticated:
+                return api_response({'error': 'Authentication required'}, status=401)
+            if identity.role not in roles:
+                return api_response({'error': f"{' or '.join(roles).title()} access only"}, status=403)
+            return view_func(request, *args, **kwargs)
+        return _wrapped_view
+    return decorator
+
+
+def _revisioned(identity):
+    """The landlord or tenant row whose revision covers everything the identity can see"""
+    return identity.landlord if identity.role == 'landlord' else identity.tenant
+
+
+def api_etag(request, *args, **kwargs):
+    """
+    Strong ETag from the caller's change counter (loaded with the identity):
+    - Any write the caller can see advances the counter, so an unchanged
+      poll is answered 304 before the view runs a single query
+    - The full path is hashed in, so pages of one resource never share a tag
+    """
+    row = _revisioned(request.identity)
+    path = hashlib.md5(request.get_full_path().encode(), usedforsecurity=False).hexdigest()[:12]
+    return f'"{API_VERSION}.{request.identity.role}{row.pk}.{row.revision}.{path}"'
+
+
+def api_last_modified(request, *args, **kwargs):
+    return _revisioned(request.identity).revised_at
+
+
+def conditional(view_func):
+    """GET only; unchanged resources are answered 304 from the ETag / Last-Modified"""
+    @require_GET
+    @condition(etag_func=api_etag, last_modified_func=api_last_modified)
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        # Always revalidate: the tags cost nothing to check
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    return _wrapped_view
+
+
+# Compact serializers: short keys, only what the dashboards show
+
+def money(value):
+    # Raw SQL returns a number on SQLite, a Decimal on PostgreSQL
+    return None if value is None else Decimal(str(value)).quantize(Decimal('0.01'))
+
+
+def property_json(property):
+    return {
+        'id': property.property_id,
+        'name': property.property_name,
+        'city': property.city,
+        'state': property.state,
+        'zip': property.zip_code,
+        'lease_id': property.current_lease_id,
+        'lease_status': property.current_lease_status,
+    }
+
+
+def lease_tenant_json(lease_tenant):
+    property = lease_tenant.lease.property
+    return {
+        'lease_id': lease_tenant.lease.lease_id,
+        'confirmed': lease_tenant.confirmed,
+        'property': {
+            'id': property.property_id,
+            'name': property.property_name,
+            'address': [line for line in (property.address_line_1, property.address_line_2) if line],
+            'city': property.city,
+            'state': property.state,
+            'zip': property.zip_code,
+        },
+    }
+
+
+# Views
+
+@api_login_required('landlord')
+@conditional
+def landlord_dashboard(request):
+    """The landlord's properties, keyset paged like the HTML dashboard (?after=, ?page_size=)"""
+    landlord = request.identity.landlord
+    page_size = get_page_size(request)
+    cursor = get_cursor(request)
+
+    def load_properties():
+        properties = Property.objects.filter(landlord=landlord).filter(
+            after_cursor(cursor)
+        ).only(
+            'property_id', 'property_name', 'city', 'state', 'zip_code',
+            'current_lease_id', 'current_lease_status'
+        ).order_by('property_name', 'property_id')[:page_size + 1]
+        rows, next_cursor = split_page(
+            list(properties), page_size, lambda p: (p.property_name, p.property_id)
+        )
+        return [property_json(p) for p in rows], next_cursor
+
+    # Keyed by revision too: the cache version is bumped only after commit
+    properties, next_cursor = cached(
+        'api_landlord_dashboard', [('landlord', landlord.landlord_id)], load_properties,
+        cursor, page_size, landlord.revision
+    )
+    return api_response({
+        'properties': properties,
+        'next': page_links(request, next_cursor)['next_page_url'],
+    })
+
+
+@api_login_required('tenant')
+@conditional
+def tenant_dashboard(request):
+    """The tenant's lease cards"""
+    tenant = request.identity.tenant
+    leases = cached(
+        'api_tenant_dashboard', [('tenant', tenant.tenant_id)],
+        lambda: [lease_tenant_json(lt) for lt in tenant_dashboard_leases(tenant)],
+        tenant.revision
+    )
+    return api_response({'leases': leases})
+
+
+@api_login_required('landlord', 'tenant')
+@conditional
+def lease_details(request, lease_id):
+    """One lease and its tenants, for its landlord or any tenant on it"""
+    context = get_lease_details(request.identity, lease_id)
+    if not isinstance(context, dict):
+        return api_response({'error': context.content.decode()}, status=403)
+    lease = context['lease']
+    return api_response({
+        'id': lease['lease_id'],
+        'property_id': lease['property_id'],
+        'start': lease['lease_start_date'],
+        'end': lease['lease_end_date'],
+        'rent': money(lease['monthly_rent']),
+        'status': lease['status'],
+        'tenants': [
+            {'id': lt['tenant_id'], 'email': lt['email'], 'confirmed': lt['confirmed']}
+            for lt in context['lease_tenants']
+        ],
+    })
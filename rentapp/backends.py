@@ -0,0 +1,41 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User as DjangoUser
+
+# Auth user, rentapp user and both role rows in one LEFT JOINed row
+PROFILE_RELATED = ('rentapp_user__landlord', 'rentapp_user__tenant')
+
+
+class RentappBackend(ModelBackend):
+    """
+    ModelBackend whose every user lookup also loads the rentapp profile:
+    - authenticate(): one indexed username lookup for the login view
+    - get_user()/aget_user(): one indexed pk lookup restores the session
+      user and its role rows, which is all request.identity needs
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None or password is None:
+            return None
+        try:
+            user = DjangoUser.objects.select_related(*PROFILE_RELATED).get(username=username)
+        except DjangoUser.DoesNotExist:
+            # Same cost as a real check so response time does not reveal accounts
+            DjangoUser().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        try:
+            user = DjangoUser.objects.select_related(*PROFILE_RELATED).get(pk=user_id)
+        except DjangoUser.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        try:
+            user = await DjangoUser.objects.select_related(*PROFILE_RELATED).aget(pk=user_id)
+        except DjangoUser.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,119 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Landlord, Tenant, Property, LeaseTenant
+
+_MISSING = object()
+
+
+def _version_key(scope, scope_id):
+    return f'rentapp:version:{scope}:{scope_id}'
+
+
+def get_versions(scopes):
+    """
+    Current version token for each (scope, id) pair:
+    - Missing tokens (never set, or evicted) are created on the fly
+    - A fresh token never matches entries cached under an older one
+    """
+    keys = [_version_key(scope, scope_id) for scope, scope_id in scopes]
+    versions = cache.get_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(scopes):
+    """Async variant of get_versions"""
+    keys = [_version_key(scope, scope_id) for scope, scope_id in scopes]
+    versions = await cache.aget_many(keys)
+    missing = {key: time.time_ns() for key in keys if key not in versions}
+    if missing:
+        await cache.aset_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def bump(scope, scope_ids):
+    """Invalidate everything cached under the given scope ids once the transaction commits"""
+    keys = [_version_key(scope, scope_id) for scope_id in set(scope_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.set_many({key: time.time_ns() for key in keys}, None))
+
+
+def _cache_key(name, scopes, versions, args):
+    key = ':'.join(
+        ['rentapp', name]
+        + [f'{scope}{scope_id}.{version}' for (scope, scope_id), version in zip(scopes, versions)]
+    )
+    if args:
+        # Filter values may contain spaces, which some cache backends reject
+        key += ':' + hashlib.md5(repr(args).encode(), usedforsecurity=False).hexdigest()
+    return key
+
+
+def cached(name, scopes, builder, *args, timeout=None):
+    """
+    Return builder(), cached per name/args under the version of every scope:
+    - scopes is a list of (scope, id) pairs such as ('landlord', 3)
+    - Bumping any of those scopes makes the next call rebuild the value
+    """
+    key = _cache_key(name, scopes, get_versions(scopes), args)
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = builder()
+        cache.set(key, value, settings.RENTAPP_CACHE_TIMEOUT if timeout is None else timeout)
+    return value
+
+
+async def acached(name, scopes, builder, *args, timeout=None):
+    """Async variant of cached; builder is a coroutine function"""
+    key = _cache_key(name, scopes, await aget_versions(scopes), args)
+    value = await cache.aget(key, _MISSING)
+    if value is _MISSING:
+        value = await builder()
+        await cache.aset(key, value, settings.RENTAPP_CACHE_TIMEOUT if timeout is None else timeout)
+    return value
+
+
+# Invalidation hooks called by the write views; they also advance the
+# landlord and tenant revisions behind the API's ETags
+
+def _changed(landlord_ids, tenant_ids):
+    bump('landlord', landlord_ids)
+    bump('tenant', tenant_ids)
+    Landlord.advance(landlord_ids)
+    Tenant.advance(tenant_ids)
+
+
+def invalidate_lease(landlord_id, lease_id):
+    """A lease or its tenant list changed: the landlord and every tenant on it"""
+    _changed([landlord_id], list(LeaseTenant.objects.filter(lease_id=lease_id).values_list('tenant_id', flat=True)))
+
+
+def invalidate_property(property):
+    """A property changed: its owner, its detail page and every tenant leasing it"""
+    bump('property', [property.property_id])
+    _changed([property.landlord_id], list(LeaseTenant.objects.filter(
+        lease__property_id=property.property_id
+    ).values_list('tenant_id', flat=True)))
+
+
+def invalidate_properties(property_ids):
+    """invalidate_property for many properties at once (maintenance commands)"""
+    bump('property', property_ids)
+    _changed(
+        list(Property.objects.filter(pk__in=property_ids).values_list('landlord_id', flat=True)),
+        list(LeaseTenant.objects.filter(lease__property_id__in=property_ids).values_list('tenant_id', flat=True))
+    )
+
+
+def invalidate_landlord(landlord_id, tenant_ids=()):
+    """Properties or leases were bulk-created: the landlord and the tenants invited to them"""
+    _changed([landlord_id], tenant_ids)
@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+
+# Rows fetched from the database (and written to the client) per step
+EXPORT_CHUNK_SIZE = 2000
+
+
+def fetch_chunks(sql, params, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Lists of up to chunk_size rows from a raw SELECT:
+    - chunked_cursor is a server-side cursor on PostgreSQL and SQLite
+      steps through results lazily, so only one chunk is in memory
+    - Closing the generator early (client went away) closes the cursor
+    """
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, params)
+        while rows := cursor.fetchmany(chunk_size):
+            yield rows
+
+
+async def afetch_chunks(sql, params, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Async variant of fetch_chunks for ASGI:
+    - Every fetch runs through thread-sensitive sync_to_async, so the
+      cursor stays on the one thread (and connection) that opened it
+    """
+    chunks = fetch_chunks(sql, params, chunk_size)
+    next_chunk = sync_to_async(lambda: next(chunks, None))
+    try:
+        while (rows := await next_chunk()) is not None:
+            yield rows
+    finally:
+        await sync_to_async(chunks.close)()
+
+
+class CSVEncoder:
+    content_type = 'text/csv; charset=utf-8'
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def _lines(self, rows):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+
+    def header(self):
+        return self._lines([self.columns])
+
+    def encode(self, rows):
+        return self._lines(rows)
+
+    def footer(self):
+        return ''
+
+
+class JSONEncoder:
+    """A JSON array of objects keyed by column, written one chunk at a time"""
+    content_type = 'application/json'
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.first = True
+
+    def header(self):
+        return '['
+
+    def encode(self, rows):
+        text = ',\n'.join(
+            json.dumps(dict(zip(self.columns, row)), cls=DjangoJSONEncoder) for row in rows
+        )
+        prefix, self.first = ('\n' if self.first else ',\n'), False
+        return prefix + text
+
+    def footer(self):
+        return '\n]\n'
+
+
+ENCODERS = {'csv': CSVEncoder, 'json': JSONEncoder}
+
+
+def stream(encoder, chunks):
+    """Encoded output: the header first (before any query runs), then one piece per chunk"""
+    yield encoder.header()
+    for rows in chunks:
+        yield encoder.encode(rows)
+    yield encoder.footer()
+
+
+async def astream(encoder, chunks):
+    """Async variant of stream over afetch_chunks"""
+    yield encoder.header()
+    async for rows in chunks:
+        yield encoder.encode(rows)
+    yield encoder.footer()
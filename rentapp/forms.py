@@ -2,6 +2,36 @@ from django import forms
 from django.core.exceptions import ValidationError
 from .models import Lease, Tenant, Property
 
+def resolve_tenant_emails(emails):
+    """Map each email that belongs to a tenant account to its Tenant in a single IN query"""
+    tenants = Tenant.objects.select_related('user').filter(user__email__in=emails)
+    return {tenant.user.email: tenant for tenant in tenants}
+
+class TenantEmailsMixin:
+    """
+    Shared tenant_emails validation for lease forms:
+    - Splits the comma separated list, skipping blanks and duplicates
+    - Resolves every email with one query via resolve_tenants
+    - Leaves the resolved tenants on self.tenants for the view
+    """
+    def resolve_tenants(self, emails):
+        return resolve_tenant_emails(emails)
+
+    def clean_tenant_emails(self):
+        emails = list(dict.fromkeys(
+            email.strip() for email in self.cleaned_data['tenant_emails'].split(',') if email.strip()
+        ))
+        tenants_by_email = self.resolve_tenants(emails)
+        invalid_emails = [email for email in emails if email not in tenants_by_email]
+        
+        if invalid_emails:
+            raise ValidationError(
+                f"No tenant accounts found for these emails: {', '.join(invalid_emails)}"
+            )
+        
+        self.tenants = [tenants_by_email[email] for email in emails]
+        return emails
+
 class PropertyForm(forms.ModelForm):
     class Meta:
         model = Property
@@ -19,7 +49,7 @@ class PropertyForm(forms.ModelForm):
             'bathrooms': forms.NumberInput(attrs={'class': 'form-control', 'min': '0', 'step': '0.5'})
         }
 
-class LeaseCreateForm(forms.ModelForm):
+class LeaseCreateForm(TenantEmailsMixin, forms.ModelForm):
     tenant_emails = forms.CharField(
         widget=forms.TextInput(attrs={'class': 'form-control'}),
         help_text='Enter tenant email addresses separated by commas'
@@ -34,27 +64,6 @@ class LeaseCreateForm(forms.ModelForm):
             'monthly_rent': forms.NumberInput(attrs={'class': 'form-control', 'min': '0', 'step': '0.01'})
         }
 
-    def clean_tenant_emails(self):
-        emails = [email.strip() for email in self.cleaned_data['tenant_emails'].split(',')]
-        tenants = []
-        invalid_emails = []
-        
-        for email in emails:
-            if not email:
-                continue
-            try:
-                tenant = Tenant.objects.get(user__email=email)
-                tenants.append(tenant)
-            except Tenant.DoesNotExist:
-                invalid_emails.append(email)
-        
-        if invalid_emails:
-            raise ValidationError(
-                f"No tenant accounts found for these emails: {', '.join(invalid_emails)}"
-            )
-        
-        return emails
-
     def clean(self):
         cleaned_data = super().clean()
         start_date = cleaned_data.get('lease_start_date')
@@ -65,7 +74,7 @@ class LeaseCreateForm(forms.ModelForm):
         
         return cleaned_data
 
-class LeaseEditForm(forms.ModelForm):
+class LeaseEditForm(TenantEmailsMixin, forms.ModelForm):
     tenant_emails = forms.CharField(
         widget=forms.TextInput(attrs={'class': 'form-control'}),
         help_text='Enter tenant email addresses separated by commas'
@@ -83,33 +92,12 @@ class LeaseEditForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.instance.pk:
-            current_tenants = self.instance.leasetenant_set.all()
-            self.fields['tenant_emails'].initial = ", ".join(
-                [lt.tenant.user.email for lt in current_tenants]
+            current_emails = self.instance.leasetenant_set.values_list(
+                'tenant__user__email', flat=True
             )
+            self.fields['tenant_emails'].initial = ", ".join(current_emails)
         self.order_fields(['tenant_emails', 'lease_start_date', 'lease_end_date', 'monthly_rent'])
 
-    def clean_tenant_emails(self):
-        emails = [email.strip() for email in self.cleaned_data['tenant_emails'].split(',')]
-        tenants = []
-        invalid_emails = []
-        
-        for email in emails:
-            if not email:  # Skip empty emails
-                continue
-            try:
-                tenant = Tenant.objects.get(user__email=email)
-                tenants.append(tenant)
-            except Tenant.DoesNotExist:
-                invalid_emails.append(email)
-        
-        if invalid_emails:
-            raise ValidationError(
-                f"No tenant accounts found for these emails: {', '.join(invalid_emails)}"
-            )
-        
-        return emails
-
     def clean(self):
         cleaned_data = super().clean()
         start_date = cleaned_data.get('lease_start_date')
@@ -119,4 +107,9 @@ class LeaseEditForm(forms.ModelForm):
             raise ValidationError("End date must be after start date")
         
         return cleaned_data
-    
+
+class PortfolioImportForm(forms.Form):
+    csv_file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': 'form-control', 'accept': '.csv'}),
+        help_text='One property per row; lease columns are optional'
+    )
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2 hasher with PASSWORD_HASH_ITERATIONS as the work factor:
+    - Same algorithm name, so every existing hash still verifies
+    - Hashes with a different iteration count are upgraded on the next
+      successful login (check_password's setter), in either direction
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+    def must_update(self, encoded):
+        decoded = self.decode(encoded)
+        return decoded['iterations'] != self.iterations or super().must_update(encoded)
@@ -0,0 +1,170 @@
+import csv
+from itertools import islice
+
+from django.db import DatabaseError, transaction
+
+from .cache import invalidate_landlord
+from .forms import LeaseCreateForm, PropertyForm, resolve_tenant_emails
+from .models import Property, Lease, LeaseTenant, LandlordAnalyticsRollup
+
+PROPERTY_COLUMNS = PropertyForm.Meta.fields
+LEASE_COLUMNS = ['tenant_emails', 'lease_start_date', 'lease_end_date', 'monthly_rent']
+IMPORT_COLUMNS = PROPERTY_COLUMNS + LEASE_COLUMNS
+
+
+class ImportPropertyForm(PropertyForm):
+    """PropertyForm rules, minus the per-row name uniqueness query (checked per chunk instead)"""
+
+    def validate_unique(self):
+        pass
+
+
+class ImportLeaseForm(LeaseCreateForm):
+    """LeaseCreateForm rules with tenant emails looked up in the chunk's pre-resolved map"""
+
+    def __init__(self, *args, tenants_by_email, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tenants_by_email = tenants_by_email
+
+    def resolve_tenants(self, emails):
+        return {email: self.tenants_by_email[email] for email in emails if email in self.tenants_by_email}
+
+
+class ImportResult:
+    """Counts and per-row errors of an import run"""
+
+    def __init__(self, max_errors):
+        self.properties = 0
+        self.leases = 0
+        self.error_count = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def error(self, line, message):
+        # Only the first max_errors are kept, so a bad file cannot grow memory
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line, message))
+
+
+def form_errors(form):
+    return '; '.join(
+        f'{field}: {message}' if field != '__all__' else message
+        for field, messages in form.errors.items() for message in messages
+    )
+
+
+def import_portfolio(landlord, lines, chunk_size=500, max_errors=1000):
+    """
+    Stream a properties (and optional leases) CSV into the landlord's portfolio:
+    - Rows are read and written chunk_size at a time, so memory stays flat
+    - Each row is validated with PropertyForm / LeaseCreateForm rules;
+      names and tenant emails are resolved with one query per chunk
+    - Valid rows of a chunk are bulk-created in one transaction; invalid
+      rows are reported by line number and skipped
+    - A line that cannot be decoded or parsed stops the import there; the
+      rows before it are still imported and the line is reported
+    - Raises ValueError when the header is unreadable or lacks a property column
+    """
+    reader = csv.DictReader(lines)
+    try:
+        fieldnames = reader.fieldnames or []
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Unreadable CSV header: {e}")
+    missing = [column for column in PROPERTY_COLUMNS if column not in fieldnames]
+    if missing:
+        raise ValueError(f"Missing CSV columns: {', '.join(missing)}")
+
+    result = ImportResult(max_errors)
+    rows = read_rows(reader, result)
+    while chunk := list(islice(rows, chunk_size)):
+        import_chunk(landlord, chunk, result)
+    result.errors.sort(key=lambda error: error[0])
+    return result
+
+
+def read_rows(reader, result):
+    """
+    (line, row) pairs until the end of the file or the first unreadable line.
+    Line 1 is the header; rows with quoted newlines make this approximate.
+    """
+    line = 2
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError) as e:
+            # The decoder or parser cannot resume mid-file
+            result.error(line, f"Unreadable CSV, nothing after this line was imported: {e}")
+            return
+        yield line, row
+        line += 1
+
+
+def import_chunk(landlord, chunk, result):
+    names = [(row.get('property_name') or '').strip() for _, row in chunk]
+    taken = set(Property.objects.filter(property_name__in=names).values_list('property_name', flat=True))
+    emails = {
+        email.strip()
+        for _, row in chunk for email in (row.get('tenant_emails') or '').split(',') if email.strip()
+    }
+    tenants_by_email = resolve_tenant_emails(emails)
+
+    planned = []
+    for line, row in chunk:
+        property_form = ImportPropertyForm({column: row.get(column) or '' for column in PROPERTY_COLUMNS})
+        if not property_form.is_valid():
+            result.error(line, form_errors(property_form))
+            continue
+        name = property_form.cleaned_data['property_name']
+        if name in taken:
+            result.error(line, f"property_name: A property named {name!r} already exists")
+            continue
+
+        lease_form = None
+        lease_data = {column: (row.get(column) or '').strip() for column in LEASE_COLUMNS}
+        if any(lease_data.values()):
+            lease_form = ImportLeaseForm(lease_data, tenants_by_email=tenants_by_email)
+            if not lease_form.is_valid():
+                result.error(line, form_errors(lease_form))
+                continue
+
+        taken.add(name)
+        planned.append((line, property_form, lease_form))
+
+    if planned:
+        write_chunk(landlord, planned, result)
+
+
+def write_chunk(landlord, planned, result):
+    properties, leases, lease_tenants = [], [], []
+    for _, property_form, lease_form in planned:
+        property = property_form.save(commit=False)
+        property.landlord = landlord
+        properties.append(property)
+        if lease_form:
+            # Same as add_lease_to_property: inactive until every tenant confirms
+            lease = lease_form.save(commit=False)
+            lease.property = property
+            lease.status = 'inactive'
+            leases.append(lease)
+            lease_tenants += [LeaseTenant(lease=lease, tenant=tenant) for tenant in lease_form.tenants]
+
+    try:
+        with transaction.atomic(), LandlordAnalyticsRollup.tracking() as tracked:
+            # bulk_create fills in the primary keys the leases and tenants point at
+            Property.objects.bulk_create(properties)
+            Lease.objects.bulk_create(leases)
+            LeaseTenant.objects.bulk_create(lease_tenants)
+            tracked.update(property.property_id for property in properties)
+            Property.refresh_current_leases(tracked)
+            invalidate_landlord(landlord.landlord_id, {lt.tenant_id for lt in lease_tenants})
+    except DatabaseError as e:
+        # e.g. a property name taken concurrently: the whole chunk is skipped
+        for line, _, _ in planned:
+            result.error(line, f"Not imported, chunk failed: {e}")
+        return
+
+    result.properties += len(properties)
+    result.leases += len(leases)
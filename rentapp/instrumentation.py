@@ -0,0 +1,106 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+
+# Metrics of the request being served; None outside instrumented requests.
+# A ContextVar follows the request into sync_to_async threads under ASGI.
+current_metrics = ContextVar('rentapp_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters collected for one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.slowest_sql = None
+        self.slowest_time = 0.0
+        self.template_time = 0.0
+        self.statements = Counter()
+
+    def record_query(self, sql, params, elapsed):
+        self.queries += 1
+        self.sql_time += elapsed
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_sql = sql
+        try:
+            self.statements[(sql, repr(params))] += 1
+        except TypeError:
+            pass
+
+    @property
+    def duplicates(self):
+        """Statements run more than once with the same parameters, most repeated first"""
+        return [(sql, count) for (sql, _), count in self.statements.most_common() if count > 1]
+
+    def server_timing(self, total):
+        """Server-Timing header value, durations in milliseconds"""
+        entries = [
+            f'sql;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+            f'tpl;dur={self.template_time * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ]
+        duplicates = sum(count - 1 for _, count in self.duplicates)
+        if duplicates:
+            entries.append(f'dup;desc="{duplicates} duplicate queries"')
+        return ', '.join(entries)
+
+
+def record_query(execute, sql, params, many, context):
+    """connection.execute_wrapper hook: times every statement of an instrumented request"""
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.record_query(sql, params, time.perf_counter() - started)
+
+
+def install_query_recorder():
+    """
+    Add record_query to every connection of the calling thread, once:
+    - Connections are per thread, so async requests call this in the
+      thread their ORM queries run on (via sync_to_async)
+    - The wrapper is a no-op outside instrumented requests
+    """
+    for connection in connections.all(initialized_only=False):
+        if record_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(record_query)
+
+
+class TimedTemplate:
+    """Backend template wrapper that adds its render time to the request metrics"""
+
+    def __init__(self, template):
+        self.template = template
+
+    @property
+    def origin(self):
+        return self.template.origin
+
+    def render(self, context=None, request=None):
+        metrics = current_metrics.get()
+        if metrics is None:
+            return self.template.render(context, request)
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """DjangoTemplates that times each top-level render (includes and extends count towards it)"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
@@ -0,0 +1,317 @@
+import copy
+import json
+import math
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rentapp import urls
+from rentapp.importer import IMPORT_COLUMNS
+from rentapp.models import Landlord, Tenant, Property, Lease, LeaseTenant, LandlordAnalyticsRollup
+
+
+def lease_form(ctx):
+    lease = ctx['lease']
+    return {
+        'tenant_emails': ctx['tenant'].user.email,
+        'lease_start_date': lease.lease_start_date.isoformat(),
+        'lease_end_date': lease.lease_end_date.isoformat(),
+        'monthly_rent': str(lease.monthly_rent),
+    }
+
+
+def property_form(ctx, **changes):
+    property = ctx['property']
+    data = {
+        field: getattr(property, field)
+        for field in ['property_name', 'address_line_1', 'address_line_2', 'city', 'state',
+                      'zip_code', 'square_footage', 'bedrooms', 'bathrooms']
+    }
+    data.update(changes)
+    return data
+
+
+def import_form(ctx, rows=100):
+    """A CSV upload of `rows` properties copied from the fixture, each with a lease"""
+    values = {**property_form(ctx), **lease_form(ctx)}
+    lines = [','.join(IMPORT_COLUMNS)] + [
+        ','.join(
+            f'Benchmark import {i}' if column == 'property_name' else f'"{values[column]}"'
+            for column in IMPORT_COLUMNS
+        )
+        for i in range(rows)
+    ]
+    return {'csv_file': SimpleUploadedFile('portfolio.csv', '\n'.join(lines).encode(), content_type='text/csv')}
+
+
+def profile_form(ctx):
+    return {'first_name': 'Bench', 'last_name': 'Mark', 'phone': '555-0000'}
+
+
+# (persona, method, route name, URL kwargs, POST data, query string)
+# Every route in rentapp/urls.py needs at least one scenario, the runner refuses to start otherwise
+SCENARIOS = [
+    ('anonymous', 'GET', 'home', None, None, None),
+    ('anonymous', 'GET', 'login', None, None, None),
+    ('anonymous', 'POST', 'login', None, lambda ctx: {
+        'email': ctx['landlord'].user.email, 'password': ctx['password'], 'role': 'landlord'
+    }, None),
+    ('anonymous', 'GET', 'signup', None, None, None),
+    ('anonymous', 'POST', 'signup', None, lambda ctx: {
+        'email': 'benchmark-signup@example.com', 'password': ctx['password'], 'role': 'tenant',
+        'first_name': 'Bench', 'last_name': 'Mark', 'phone': '555-0000'
+    }, None),
+
+    ('landlord', 'GET', 'landlord_dashboard', None, None, None),
+    ('landlord', 'GET', 'landlord_analytics', None, None, None),
+    ('landlord', 'GET', 'landlord_analytics', None, None, {'status': 'active'}),
+    ('landlord', 'GET', 'landlord_analytics_export', lambda ctx: ['csv'], None, None),
+    ('landlord', 'GET', 'landlord_analytics_export', lambda ctx: ['json'], None, {'status': 'active'}),
+    ('landlord', 'GET', 'property_create', None, None, None),
+    ('landlord', 'POST', 'property_create', None,
+     lambda ctx: property_form(ctx, property_name='Benchmark property'), None),
+    ('landlord', 'GET', 'property_import', None, None, None),
+    ('landlord', 'POST', 'property_import', None, import_form, None),
+    ('landlord', 'GET', 'property_update', lambda ctx: [ctx['property'].property_id], None, None),
+    ('landlord', 'POST', 'property_update', lambda ctx: [ctx['property'].property_id],
+     lambda ctx: property_form(ctx, zip_code='00000'), None),
+    ('landlord', 'POST', 'property_delete', lambda ctx: [ctx['property'].property_id], {}, None),
+    ('landlord', 'GET', 'add_lease_to_property', lambda ctx: [ctx['property'].property_id], None, None),
+    ('landlord', 'POST', 'add_lease_to_property', lambda ctx: [ctx['property'].property_id], lease_form, None),
+    ('landlord', 'GET', 'edit_lease', lambda ctx: [ctx['property'].property_id], None, None),
+    ('landlord', 'POST', 'edit_lease', lambda ctx: [ctx['property'].property_id], lease_form, None),
+    ('landlord', 'POST', 'cancel_lease', lambda ctx: [ctx['property'].property_id], {}, None),
+    ('landlord', 'GET', 'property_details', lambda ctx: [ctx['property'].property_id], None, None),
+    ('landlord', 'GET', 'view_lease_details', lambda ctx: [ctx['lease'].lease_id], None, None),
+    ('landlord', 'GET', 'tenant_details',
+     lambda ctx: [ctx['tenant'].tenant_id, ctx['lease'].lease_id], None, None),
+    ('landlord', 'GET', 'api_landlord_dashboard', None, None, None),
+    ('landlord', 'GET', 'api_lease_details', lambda ctx: [ctx['lease'].lease_id], None, None),
+    ('landlord', 'GET', 'user_profile', None, None, None),
+    ('landlord', 'POST', 'user_profile', None, profile_form, None),
+    ('landlord', 'GET', 'logout', None, None, None),
+
+    ('tenant', 'GET', 'tenant_dashboard', None, None, None),
+    ('tenant', 'POST', 'accept_lease', lambda ctx: [ctx['lease'].lease_id], {}, None),
+    ('tenant', 'POST', 'decline_lease', lambda ctx: [ctx['lease'].lease_id], {}, None),
+    ('tenant', 'POST', 'break_lease', lambda ctx: [ctx['confirmed_lease'].lease_id], {}, None),
+    ('tenant', 'GET', 'property_details', lambda ctx: [ctx['property'].property_id], None, None),
+    ('tenant', 'GET', 'view_lease_details', lambda ctx: [ctx['lease'].lease_id], None, None),
+    ('tenant', 'GET', 'landlord_details',
+     lambda ctx: [ctx['landlord'].landlord_id, ctx['property'].property_id], None, None),
+    ('tenant', 'GET', 'api_tenant_dashboard', None, None, None),
+    ('tenant', 'GET', 'api_lease_details', lambda ctx: [ctx['lease'].lease_id], None, None),
+    ('tenant', 'GET', 'user_profile', None, None, None),
+    ('tenant', 'POST', 'user_profile', None, profile_form, None),
+    ('tenant', 'GET', 'logout', None, None, None),
+]
+
+
+def percentile(samples, p):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def scenario_key(persona, method, name, query):
+    key = f'{persona} {method} {name}'
+    if query:
+        key += '?' + '&'.join(f'{k}={v}' for k, v in sorted(query.items()))
+    return key
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every rentapp route in-process as landlord, tenant and anonymous personas "
+        "and report latency percentiles, SQL queries and response sizes. All writes are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=2, help='Untimed requests per endpoint first')
+        parser.add_argument('--password', default='rentre-perf', help='Password used for the login scenario')
+        parser.add_argument(
+            '--warm-cache', action='store_true',
+            help='Keep the dashboard/analytics cache on (default measures every request uncached)',
+        )
+        parser.add_argument('--only', action='append', default=[], help='Only run endpoints containing this text')
+        parser.add_argument('--output', help='Write the results as a JSON baseline to this file')
+        parser.add_argument('--compare', help='Fail if an endpoint regressed against this JSON baseline')
+        parser.add_argument(
+            '--threshold', type=float, default=0.25,
+            help='Allowed relative p95 slowdown in compare mode (default 0.25 = 25%%)',
+        )
+        parser.add_argument(
+            '--min-delta-ms', type=float, default=2.0,
+            help='Ignore p95 slowdowns smaller than this many milliseconds (default 2)',
+        )
+
+    def handle(self, *args, **options):
+        missing = {p.name for p in urls.urlpatterns} - {name for _, _, name, _, _, _ in SCENARIOS}
+        if missing:
+            raise CommandError(f"No benchmark scenario for route(s): {', '.join(sorted(missing))}")
+
+        overrides = {} if options['warm_cache'] else {'RENTAPP_CACHE_TIMEOUT': 0}
+        # Measure the full login path on every iteration instead of the throttled rejection
+        overrides.update(LOGIN_THROTTLE_BACKEND='local', LOGIN_THROTTLE_ACCOUNT='1000000/1', LOGIN_THROTTLE_IP='1000000/1')
+        with override_settings(**overrides), transaction.atomic():
+            ctx = self.load_personas(options['password'])
+            results = {}
+            for persona, method, name, url_args, data, query in SCENARIOS:
+                key = scenario_key(persona, method, name, query)
+                if options['only'] and not any(text in key for text in options['only']):
+                    continue
+                url = reverse(name, args=url_args(ctx) if url_args else None)
+                if data is not None and callable(data):
+                    data = data(ctx)
+                results[key] = self.measure(
+                    ctx['clients'][persona], method, url, data if method == 'POST' else query,
+                    options['warmup'], options['iterations']
+                )
+            transaction.set_rollback(True)
+
+        self.report(results)
+        baseline = {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'iterations': options['iterations'],
+            'warm_cache': options['warm_cache'],
+            'database': connection.vendor,
+            'endpoints': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(baseline, f, indent=2, sort_keys=True)
+            self.stdout.write(f"Wrote baseline to {options['output']}")
+        if options['compare']:
+            self.compare(results, options)
+
+    def load_personas(self, password):
+        """
+        Busiest landlord and busiest tenant from the dataset, plus a fixture property:
+        - Dashboards and analytics run against the real portfolios
+        - Lease views need a property with exactly one lease, so two are added
+          (inside the rolled-back transaction) with both personas on them:
+          one pending lease to accept/decline, one confirmed lease to break
+        """
+        landlord = Landlord.objects.select_related('user__auth_user').annotate(units=Count('property')).order_by(
+            '-units', 'landlord_id'
+        ).first()
+        tenant = Tenant.objects.select_related('user__auth_user').annotate(leases=Count('leasetenant')).order_by(
+            '-leases', 'tenant_id'
+        ).first()
+        if landlord is None or tenant is None:
+            raise CommandError("Need at least one landlord and one tenant; run generate_portfolio first")
+
+        leases = []
+        for name, confirmed in [('Benchmark fixture', False), ('Benchmark fixture (confirmed)', True)]:
+            property = Property.objects.create(
+                property_name=name, landlord=landlord, address_line_1='1 Bench St',
+                city='Austin', state='TX', zip_code='78701', square_footage=900, bedrooms=2,
+                bathrooms=Decimal('1.5')
+            )
+            lease = Lease.objects.create(
+                property=property, lease_start_date=date(2024, 1, 1), lease_end_date=date(2025, 1, 1),
+                monthly_rent=Decimal('1500.00'), status='active' if confirmed else 'inactive'
+            )
+            LeaseTenant.objects.create(lease=lease, tenant=tenant, confirmed=confirmed)
+            leases.append(lease)
+        with LandlordAnalyticsRollup.tracking(lease.property_id for lease in leases) as tracked:
+            Property.refresh_current_leases(tracked)
+        lease, confirmed_lease = leases
+        property = lease.property
+
+        ctx = {
+            'password': password,
+            'landlord': landlord,
+            'property': property,
+            'lease': lease,
+            'confirmed_lease': confirmed_lease,
+            'tenant': tenant,
+            'clients': {'anonymous': Client(HTTP_HOST='localhost')},
+        }
+        for role, user in [('landlord', landlord.user), ('tenant', tenant.user)]:
+            client = Client(HTTP_HOST='localhost')
+            client.force_login(user.auth_user)
+            session = client.session
+            session['user_id'] = str(user.user_id)
+            session['role'] = role
+            session.save()
+            ctx['clients'][role] = client
+        self.stdout.write(
+            f"Landlord {landlord.user.email} ({landlord.units} properties), "
+            f"tenant {tenant.user.email} ({tenant.leases} leases)"
+        )
+        return ctx
+
+    def measure(self, client, method, url, data, warmup, iterations):
+        latencies, queries, sql_time, size, status = [], 0, 0.0, 0, None
+        for i in range(warmup + iterations):
+            # Logout and login scenarios must not change the persona's session for the next request
+            cookies = copy.deepcopy(client.cookies)
+            # The client reads uploads to the end; rewind them for the next iteration
+            for value in (data or {}).values():
+                if hasattr(value, 'seek'):
+                    value.seek(0)
+            # Each request sees the same data: its writes are undone right after
+            with transaction.atomic(), CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = getattr(client, method.lower())(url, data, secure=True)
+                content = b''.join(response.streaming_content) if response.streaming else response.content
+                elapsed = time.perf_counter() - started
+                transaction.set_rollback(True)
+            client.cookies = cookies
+            if i >= warmup:
+                latencies.append(elapsed * 1000)
+                queries = len(captured.captured_queries)
+                sql_time += sum(float(q['time']) for q in captured.captured_queries) * 1000
+                size = len(content)
+                status = response.status_code
+        return {
+            'p50_ms': round(percentile(latencies, 50), 3),
+            'p95_ms': round(percentile(latencies, 95), 3),
+            'p99_ms': round(percentile(latencies, 99), 3),
+            'queries': queries,
+            'sql_ms': round(sql_time / iterations, 3),
+            'bytes': size,
+            'status': status,
+        }
+
+    def report(self, results):
+        width = max(len(key) for key in results) if results else 10
+        self.stdout.write(
+            f"{'endpoint':<{width}}  {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>7} {'sql ms':>8} {'bytes':>8} status"
+        )
+        for key, r in results.items():
+            self.stdout.write(
+                f"{key:<{width}}  {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+                f"{r['queries']:>7} {r['sql_ms']:>8.2f} {r['bytes']:>8} {r['status']}"
+            )
+
+    def compare(self, results, options):
+        with open(options['compare']) as f:
+            baseline = json.load(f)['endpoints']
+
+        regressions = []
+        for key, current in results.items():
+            previous = baseline.get(key)
+            if previous is None:
+                self.stdout.write(f"New endpoint (no baseline): {key}")
+                continue
+            slower = current['p95_ms'] - previous['p95_ms']
+            if slower > options['min_delta_ms'] and current['p95_ms'] > previous['p95_ms'] * (1 + options['threshold']):
+                regressions.append(f"{key}: p95 {previous['p95_ms']:.2f}ms -> {current['p95_ms']:.2f}ms")
+            if current['queries'] > previous['queries']:
+                regressions.append(f"{key}: queries {previous['queries']} -> {current['queries']}")
+
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f"{len(regressions)} regression(s) against {options['compare']}")
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {options['compare']}"))
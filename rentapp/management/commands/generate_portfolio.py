@@ -0,0 +1,214 @@
+import itertools
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User as DjangoUser
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rentapp.models import User, Landlord, Tenant, Property, Lease, LeaseTenant, LandlordAnalyticsRollup
+
+# (city, state) pairs in skew order: with --city-skew > 0 the first ones dominate
+CITIES = [
+    ('Austin', 'TX'), ('Houston', 'TX'), ('Dallas', 'TX'), ('Phoenix', 'AZ'),
+    ('Atlanta', 'GA'), ('Denver', 'CO'), ('Chicago', 'IL'), ('Seattle', 'WA'),
+    ('Nashville', 'TN'), ('Charlotte', 'NC'), ('Columbus', 'OH'), ('Portland', 'OR'),
+    ('Tampa', 'FL'), ('Orlando', 'FL'), ('Raleigh', 'NC'), ('Boise', 'ID'),
+    ('Omaha', 'NE'), ('Tucson', 'AZ'), ('Richmond', 'VA'), ('Madison', 'WI'),
+]
+STREETS = ['Main', 'Oak', 'Pine', 'Maple', 'Cedar', 'Elm', 'Lake', 'Hill', 'Park', 'River']
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Casey', 'Riley', 'Morgan', 'Jamie', 'Avery', 'Quinn']
+LAST_NAMES = ['Smith', 'Garcia', 'Nguyen', 'Patel', 'Kim', 'Brown', 'Lopez', 'Chen', 'Davis', 'Moore']
+BATHROOMS = [Decimal('1.0'), Decimal('1.5'), Decimal('2.0'), Decimal('2.5'), Decimal('3.0')]
+
+
+def parse_range(value):
+    """'LOW:HIGH' (or a single number) as an inclusive (low, high) pair"""
+    low, _, high = value.partition(':')
+    try:
+        low, high = int(low), int(high or low)
+    except ValueError:
+        raise CommandError(f"Expected LOW:HIGH, got {value!r}")
+    if low < 0 or high < low:
+        raise CommandError(f"Invalid range {value!r}")
+    return low, high
+
+
+class Command(BaseCommand):
+    help = "Load a reproducible synthetic portfolio (landlords, tenants, properties, leases) for scale testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=1, help='Random seed; the same seed gives the same data')
+        parser.add_argument('--prefix', default='gen', help='Prefix for generated emails and property names')
+        parser.add_argument('--landlords', type=int, default=10)
+        parser.add_argument('--tenants', type=int, default=100)
+        parser.add_argument(
+            '--units-per-landlord', type=parse_range, default=(1, 50), metavar='LOW:HIGH',
+            help='Properties per landlord (default 1:50)',
+        )
+        parser.add_argument(
+            '--units-distribution', choices=['uniform', 'pareto'], default='uniform',
+            help='pareto gives a few landlords most of the units, like real portfolios',
+        )
+        parser.add_argument(
+            '--leases-per-property', type=parse_range, default=(0, 3), metavar='LOW:HIGH',
+            help='Lease history per property, 0 leaves it vacant (default 0:3)',
+        )
+        parser.add_argument(
+            '--tenants-per-lease', type=parse_range, default=(1, 3), metavar='LOW:HIGH',
+            help='Tenants on each lease (default 1:3)',
+        )
+        parser.add_argument(
+            '--active-share', type=float, default=0.7,
+            help="Share of leased properties whose latest lease is active (default 0.7)",
+        )
+        parser.add_argument(
+            '--city-skew', type=float, default=1.0,
+            help='Zipf exponent over the city list; 0 spreads properties evenly (default 1.0)',
+        )
+        parser.add_argument('--password', default='rentre-perf', help='Password for every generated user')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk INSERT')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.batch_size = options['batch_size']
+        self.city_weights = list(itertools.accumulate(
+            1 / rank ** options['city_skew'] for rank in range(1, len(CITIES) + 1)
+        ))
+        prefix = options['prefix']
+
+        if not 0 <= options['active_share'] <= 1:
+            raise CommandError("--active-share must be between 0 and 1")
+        if options['tenants'] < options['tenants_per_lease'][1]:
+            raise CommandError("--tenants must be at least the upper bound of --tenants-per-lease")
+        if User.objects.filter(email__startswith=f'{prefix}-').exists():
+            raise CommandError(f"Users with prefix {prefix!r} already exist; pick another --prefix")
+
+        started = time.monotonic()
+        # Hash once: every generated user shares the same password hash
+        password = make_password(options['password'])
+        self.counts = {'properties': 0, 'leases': 0, 'lease_tenants': 0}
+
+        with transaction.atomic():
+            landlords = self.create_users(Landlord, 'landlord', options['landlords'], password)
+            self.tenant_ids = [t.tenant_id for t in self.create_users(Tenant, 'tenant', options['tenants'], password)]
+
+            pending = []
+            for landlord_no, landlord in enumerate(landlords):
+                for unit_no in range(self.units_for_landlord()):
+                    pending.append(self.plan_property(landlord, landlord_no, unit_no))
+                    if len(pending) >= self.batch_size:
+                        self.insert_properties(pending)
+                        pending = []
+            self.insert_properties(pending)
+
+            LandlordAnalyticsRollup.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {len(landlords)} landlords, {len(self.tenant_ids)} tenants, "
+            f"{self.counts['properties']} properties, {self.counts['leases']} leases and "
+            f"{self.counts['lease_tenants']} lease tenants in {time.monotonic() - started:.1f}s"
+        ))
+
+    def create_users(self, role_model, role, count, password):
+        prefix = self.options['prefix']
+        emails = [f'{prefix}-{role}-{i}@example.com' for i in range(count)]
+        auth_users = DjangoUser.objects.bulk_create(
+            [DjangoUser(username=email, email=email, password=password) for email in emails],
+            batch_size=self.batch_size
+        )
+        users = [
+            User(
+                auth_user=auth_user,
+                email=auth_user.email,
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                phone=f'555-{self.rng.randint(0, 9999):04d}'
+            )
+            for auth_user in auth_users
+        ]
+        users = User.objects.bulk_create(users, batch_size=self.batch_size)
+        return role_model.objects.bulk_create(
+            [role_model(user=user) for user in users], batch_size=self.batch_size
+        )
+
+    def units_for_landlord(self):
+        low, high = self.options['units_per_landlord']
+        if self.options['units_distribution'] == 'uniform' or low == high:
+            return self.rng.randint(low, high)
+        # Heavy tail (80/20 shape) with low as the minimum, capped at high
+        return min(high, int(max(low, 1) * self.rng.paretovariate(1.16)))
+
+    def pick_city(self):
+        return self.rng.choices(CITIES, cum_weights=self.city_weights)[0]
+
+    def plan_property(self, landlord, landlord_no, unit_no):
+        """A property and its lease history, drawn up front so the data does not depend on --batch-size"""
+        rng = self.rng
+        city, state = self.pick_city()
+        bedrooms = rng.randint(0, 5)
+        property = Property(
+            property_name=f"{self.options['prefix']} {landlord_no}-{unit_no}",
+            landlord=landlord,
+            address_line_1=f'{rng.randint(1, 9999)} {rng.choice(STREETS)} St',
+            address_line_2=f'Apt {rng.randint(1, 400)}' if rng.random() < 0.3 else '',
+            city=city,
+            state=state,
+            zip_code=f'{rng.randint(10000, 99999)}',
+            square_footage=rng.randint(400, 600 + bedrooms * 500),
+            bedrooms=bedrooms,
+            bathrooms=rng.choice(BATHROOMS)
+        )
+
+        leases = []
+        lease_count = rng.randint(*self.options['leases_per_property'])
+        latest_active = rng.random() < self.options['active_share']
+        start = date(2020, 1, 1) + timedelta(days=rng.randint(0, 365))
+        for lease_no in range(lease_count):
+            active = latest_active and lease_no == lease_count - 1
+            tenant_ids = rng.sample(self.tenant_ids, rng.randint(*self.options['tenants_per_lease']))
+            # Status must match confirmations: active needs every tenant confirmed
+            confirmed = [active or rng.random() < 0.5 for _ in tenant_ids]
+            if not active and tenant_ids and all(confirmed):
+                confirmed[-1] = False
+            rent = Decimal(800 + 350 * bedrooms) * Decimal(rng.uniform(0.8, 1.2))
+            leases.append((
+                Lease(
+                    lease_start_date=start,
+                    lease_end_date=start + timedelta(days=365),
+                    monthly_rent=rent.quantize(Decimal('0.01')),
+                    status='active' if active and tenant_ids else 'inactive'
+                ),
+                list(zip(tenant_ids, confirmed))
+            ))
+            start += timedelta(days=365)
+        return property, leases
+
+    def insert_properties(self, pending):
+        if not pending:
+            return
+        Property.objects.bulk_create([property for property, _ in pending], batch_size=self.batch_size)
+
+        leases = []
+        for property, planned in pending:
+            for lease, _ in planned:
+                lease.property = property
+                leases.append(lease)
+        Lease.objects.bulk_create(leases, batch_size=self.batch_size)
+
+        lease_tenants = [
+            LeaseTenant(lease=lease, tenant_id=tenant_id, confirmed=confirmed)
+            for _, planned in pending
+            for lease, tenants in planned
+            for tenant_id, confirmed in tenants
+        ]
+        LeaseTenant.objects.bulk_create(lease_tenants, batch_size=self.batch_size)
+        Property.refresh_current_leases([property.property_id for property, _ in pending])
+
+        self.counts['properties'] += len(pending)
+        self.counts['leases'] += len(leases)
+        self.counts['lease_tenants'] += len(lease_tenants)
+        self.stdout.write(f"  {self.counts['properties']} properties, {self.counts['leases']} leases")
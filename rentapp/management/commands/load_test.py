@@ -0,0 +1,181 @@
+import http.client
+import os
+import subprocess
+import sys
+import threading
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.urls import reverse
+from rentapp.management.commands.benchmark_views import percentile
+from rentapp.models import Landlord, Tenant, LeaseTenant
+
+
+def read_paths(lease_id):
+    """(persona, path) pairs the clients cycle through: the read traffic of a busy portfolio"""
+    return [
+        ('landlord', reverse('landlord_dashboard')),
+        ('landlord', reverse('landlord_analytics')),
+        ('landlord', reverse('landlord_analytics') + '?status=active'),
+        ('landlord', reverse('api_landlord_dashboard')),
+        ('tenant', reverse('tenant_dashboard')),
+        ('tenant', reverse('view_lease_details', args=[lease_id])),
+        ('tenant', reverse('api_tenant_dashboard')),
+    ]
+
+
+def parse_config(value):
+    """'wsgi:2:4' -> ('wsgi', 2, 4); threads only apply to wsgi"""
+    try:
+        mode, workers, threads = value.split(':')
+        if mode not in ('asgi', 'wsgi'):
+            raise ValueError
+        return mode, int(workers), int(threads)
+    except ValueError:
+        raise CommandError(f"--config expects MODE:WORKERS:THREADS with MODE asgi or wsgi, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn with gunicorn.conf.py for each --config and drive it with keep-alive "
+        "clients cycling the dashboards, analytics, lease details and API as the busiest landlord "
+        "and tenant; reports req/s, p50/p95 and errors. Read-only: run generate_portfolio first. "
+        "This is the run behind the worker and thread defaults in gunicorn.conf.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--config', action='append', default=[],
+            help='MODE:WORKERS:THREADS to serve, e.g. asgi:1:0 or wsgi:2:4 (repeatable; '
+                 'default: the gunicorn.conf.py defaults)',
+        )
+        parser.add_argument('--clients', type=int, default=16, help='Concurrent keep-alive clients')
+        parser.add_argument('--duration', type=float, default=15, help='Timed seconds per config')
+        parser.add_argument('--warmup', type=float, default=3, help='Untimed seconds per config first')
+        parser.add_argument('--port', type=int, default=8765)
+
+    def handle(self, *args, **options):
+        configs = [parse_config(value) for value in options['config']] or [None]
+        cookies, lease_id = self.create_sessions()
+        paths = read_paths(lease_id)
+        self.stdout.write(f"{'config':<22} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} errors")
+        for config in configs:
+            with self.server(config, options['port']):
+                self.drive(options['port'], paths, cookies, options['clients'], options['warmup'])
+                r = self.drive(options['port'], paths, cookies, options['clients'], options['duration'])
+            label = 'defaults' if config is None else '{} w{} t{}'.format(*config)
+            self.stdout.write(f"{label:<22} {r['rps']:>7.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['errors']}")
+
+    def create_sessions(self):
+        """Session cookies for the busiest landlord and tenant, in the configured session backend"""
+        landlord = Landlord.objects.select_related('user__auth_user').annotate(units=Count('property')).order_by(
+            '-units', 'landlord_id'
+        ).first()
+        tenant = Tenant.objects.select_related('user__auth_user').annotate(leases=Count('leasetenant')).order_by(
+            '-leases', 'tenant_id'
+        ).first()
+        lease_tenant = LeaseTenant.objects.filter(tenant=tenant).first() if tenant else None
+        if landlord is None or lease_tenant is None:
+            raise CommandError("Need a landlord and a tenant with a lease; run generate_portfolio first")
+
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+        cookies = {}
+        for role, user in [('landlord', landlord.user), ('tenant', tenant.user)]:
+            session = store()
+            session[SESSION_KEY] = str(user.auth_user.pk)
+            session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+            session[HASH_SESSION_KEY] = user.auth_user.get_session_auth_hash()
+            session['user_id'] = str(user.user_id)
+            session['role'] = role
+            session.save()
+            cookies[role] = f'{settings.SESSION_COOKIE_NAME}={session.session_key}'
+        self.stdout.write(
+            f"Landlord {landlord.user.email} ({landlord.units} properties), "
+            f"tenant {tenant.user.email} ({tenant.leases} leases)"
+        )
+        return cookies, lease_tenant.lease_id
+
+    def server(self, config, port):
+        """
+        gunicorn.conf.py as deployed, with only the worker settings overridden:
+        - DJANGO_DEBUG=True so plain-HTTP requests are not redirected to HTTPS
+          (DEBUG's query log costs every config the same)
+        """
+        env = {**os.environ, 'PORT': str(port), 'DJANGO_DEBUG': 'True'}
+        if config is not None:
+            mode, workers, threads = config
+            env.update(SERVER_MODE=mode, WEB_CONCURRENCY=str(workers), GUNICORN_THREADS=str(threads or 1))
+        return _Server(
+            [sys.executable, '-m', 'gunicorn', '-c', str(settings.BASE_DIR / 'gunicorn.conf.py'), '--log-level', 'warning'],
+            env, port
+        )
+
+    def drive(self, port, paths, cookies, clients, duration):
+        latencies, errors, lock = [], [0], threading.Lock()
+        stop = time.monotonic() + duration
+
+        def client(offset):
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            n = offset
+            while time.monotonic() < stop:
+                persona, path = paths[n % len(paths)]
+                n += 1
+                started = time.perf_counter()
+                try:
+                    conn.request('GET', path, headers={'Cookie': cookies[persona]})
+                    response = conn.getresponse()
+                    response.read()
+                    ok = response.status == 200
+                except (OSError, http.client.HTTPException):
+                    ok = False
+                    conn.close()
+                    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                with lock:
+                    if ok:
+                        latencies.append((time.perf_counter() - started) * 1000)
+                    else:
+                        errors[0] += 1
+
+        threads = [threading.Thread(target=client, args=[i]) for i in range(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return {
+            'rps': len(latencies) / duration,
+            'p50_ms': percentile(latencies, 50) if latencies else 0,
+            'p95_ms': percentile(latencies, 95) if latencies else 0,
+            'errors': errors[0],
+        }
+
+
+class _Server:
+    """A gunicorn process for the duration of a with block, started once it answers"""
+
+    def __init__(self, command, env, port):
+        self.command, self.env, self.port = command, env, port
+
+    def __enter__(self):
+        self.process = subprocess.Popen(self.command, env=self.env, cwd=settings.BASE_DIR,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+                conn.request('GET', reverse('login'))
+                conn.getresponse().read()
+                return self
+            except OSError:
+                if self.process.poll() is not None:
+                    break
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise CommandError(f"gunicorn did not start on port {self.port}: {' '.join(self.command)}")
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        self.process.wait()
@@ -0,0 +1,29 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore as DatabaseSessionStore
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Run Django's clearsessions, and after a switch to a session backend that does not "
+        "read the database (signed_cookies) also delete the django_session rows left behind: "
+        "no request can reach them and that backend's clearsessions does nothing"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per DELETE of unreachable sessions')
+
+    def handle(self, *args, **options):
+        call_command('clearsessions')
+        if issubclass(import_module(settings.SESSION_ENGINE).SessionStore, DatabaseSessionStore):
+            return
+
+        # Small batches keep each write transaction (and SQLite's lock) short
+        deleted = 0
+        while keys := list(Session.objects.values_list('pk', flat=True)[:options['batch_size']]):
+            deleted += Session.objects.filter(pk__in=keys).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} unreachable sessions"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from rentapp.models import LandlordAnalyticsRollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the landlord analytics rollup from scratch and report any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report drift and exit with an error if any is found, without rebuilding',
+        )
+
+    def handle(self, *args, **options):
+        key = lambda row: (row.landlord_id, row.city, row.state, row.status)
+        value = lambda row: (row.property_count, row.active_lease_count, row.rent_sum)
+
+        expected = {key(row): row for row in LandlordAnalyticsRollup.compute()}
+        # Emptied groups keep a zero row (see LandlordAnalyticsRollup.apply_changes)
+        stored = {key(row): row for row in LandlordAnalyticsRollup.objects.filter(property_count__gt=0)}
+
+        drift = []
+        for group in sorted(expected.keys() | stored.keys(), key=str):
+            have = value(stored[group]) if group in stored else None
+            want = value(expected[group]) if group in expected else None
+            if have != want:
+                drift.append(group)
+                self.stdout.write(f"Drift in {group}: stored {have}, expected {want}")
+
+        if options['check']:
+            if drift:
+                raise CommandError(f"{len(drift)} rollup group(s) drifted")
+            self.stdout.write(self.style.SUCCESS(f"Rollup is consistent ({len(expected)} groups)"))
+            return
+
+        LandlordAnalyticsRollup.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {len(expected)} rollup groups ({len(drift)} had drifted)"
+        ))
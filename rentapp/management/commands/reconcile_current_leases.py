@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+from rentapp.cache import invalidate_properties
+from rentapp.models import Property, Lease, LandlordAnalyticsRollup
+
+
+class Command(BaseCommand):
+    help = "Re-point every property's current lease from its lease history and report any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report drift and exit with an error if any is found, without fixing it',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000, help='Properties compared per query')
+
+    def handle(self, *args, **options):
+        ranked = Lease.current_first(models.OuterRef('pk'))
+        properties = Property.objects.annotate(
+            expected_lease=models.Subquery(ranked.values('lease_id')[:1]),
+            expected_status=models.Subquery(ranked.values('status')[:1])
+        ).values_list('pk', 'current_lease_id', 'current_lease_status', 'expected_lease', 'expected_status')
+
+        drift = []
+        for pk, lease, status, expected_lease, expected_status in properties.iterator(options['batch_size']):
+            if (lease, status) != (expected_lease, expected_status):
+                drift.append(pk)
+                self.stdout.write(
+                    f"Drift in property {pk}: stored {(lease, status)}, expected {(expected_lease, expected_status)}"
+                )
+
+        if options['check']:
+            if drift:
+                raise CommandError(f"{len(drift)} property current lease(s) drifted")
+            self.stdout.write(self.style.SUCCESS("Current leases are consistent"))
+            return
+
+        with transaction.atomic():
+            for start in range(0, len(drift), options['batch_size']):
+                batch = drift[start:start + options['batch_size']]
+                # Rollup groups are computed from the pointers
+                with LandlordAnalyticsRollup.tracking(batch):
+                    Property.refresh_current_leases(batch)
+                invalidate_properties(batch)
+        self.stdout.write(self.style.SUCCESS(f"Re-pointed {len(drift)} properties"))
@@ -0,0 +1,159 @@
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.functional import SimpleLazyObject
+
+from .instrumentation import RequestMetrics, current_metrics, install_query_recorder
+
+request_logger = logging.getLogger('rentapp.requests')
+
+
+class Identity:
+    """The signed-in rentapp user, their session role and their role rows"""
+
+    def __init__(self, user=None, role=None, landlord=None, tenant=None):
+        self.user = user
+        self.role = role
+        self.landlord = landlord
+        self.tenant = tenant
+
+    @property
+    def is_authenticated(self):
+        return self.user is not None
+
+    @property
+    def revision(self):
+        """Change counter of the landlord or tenant row, advanced by every write they can see"""
+        row = self.landlord if self.role == 'landlord' else self.tenant
+        return None if row is None else row.revision
+
+    def owns(self, property):
+        """Whether this user is the landlord of the property (no extra query)"""
+        return self.landlord is not None and property.landlord_id == self.landlord.landlord_id
+
+
+def identity_for(auth_user, user_id, role):
+    """
+    Identity from the session's auth user, which RentappBackend loaded
+    together with its rentapp profile and role rows (no extra query)
+    """
+    user = getattr(auth_user, 'rentapp_user', None) if auth_user.is_authenticated else None
+    if user is None or str(user.user_id) != str(user_id):
+        return Identity()
+    return Identity(user, role, getattr(user, 'landlord', None), getattr(user, 'tenant', None))
+
+
+def get_identity(request):
+    """Request-scoped identity, resolved at most once per request"""
+    if not hasattr(request, '_identity'):
+        request._identity = identity_for(
+            request.user, request.session.get('user_id'), request.session.get('role')
+        )
+    return request._identity
+
+
+async def aget_identity(request):
+    """Async variant of get_identity; also loads the session so templates can read it"""
+    if not hasattr(request, '_identity'):
+        request._identity = identity_for(
+            await request.auser(), await request.session.aget('user_id'), await request.session.aget('role')
+        )
+    return request._identity
+
+
+def forget_identity(request):
+    """Drop the cached identity after login, logout or a profile change"""
+    request.__dict__.pop('_identity', None)
+    request.identity = SimpleLazyObject(lambda: get_identity(request))
+
+
+class IdentityMiddleware:
+    """
+    Expose request.identity, resolved lazily on first access.
+    Runs natively under WSGI and ASGI; async views must await
+    aget_identity(request) instead of touching request.identity.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.identity = SimpleLazyObject(lambda: get_identity(request))
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.identity = SimpleLazyObject(lambda: get_identity(request))
+        return await self.get_response(request)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Opt-in (REQUEST_INSTRUMENTATION) per-request timing:
+    - Query count, SQL time and the slowest statement via an execute wrapper
+    - Template render time via rentapp.instrumentation.InstrumentedDjangoTemplates
+    - A Server-Timing header plus one JSON log line keyed by URL name
+    - Identical statements repeated within the request are flagged as duplicates
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        install_query_recorder()
+        token = current_metrics.set(RequestMetrics())
+        try:
+            response = self.get_response(request)
+            self.report(request, response, current_metrics.get())
+        finally:
+            current_metrics.reset(token)
+        return response
+
+    async def __acall__(self, request):
+        # Queries run on the request's thread-sensitive executor thread, not this one
+        await sync_to_async(install_query_recorder)()
+        token = current_metrics.set(RequestMetrics())
+        try:
+            response = await self.get_response(request)
+            self.report(request, response, current_metrics.get())
+        finally:
+            current_metrics.reset(token)
+        return response
+
+    def report(self, request, response, metrics):
+        total = time.perf_counter() - metrics.started
+        response['Server-Timing'] = metrics.server_timing(total)
+
+        match = request.resolver_match
+        duplicates = metrics.duplicates
+        entry = {
+            'url_name': match.view_name if match else None,
+            'method': request.method,
+            'status': response.status_code,
+            'total_ms': round(total * 1000, 2),
+            'queries': metrics.queries,
+            'sql_ms': round(metrics.sql_time * 1000, 2),
+            'template_ms': round(metrics.template_time * 1000, 2),
+            'slowest_sql_ms': round(metrics.slowest_time * 1000, 2),
+            'slowest_sql': metrics.slowest_sql,
+            'duplicate_queries': [{'sql': sql, 'count': count} for sql, count in duplicates],
+        }
+        request_logger.log(logging.WARNING if duplicates else logging.INFO, json.dumps(entry))
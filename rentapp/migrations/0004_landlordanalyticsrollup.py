@@ -0,0 +1,30 @@
+# Generated by Django 5.1 on 2026-10-17 18:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0003_alter_lease_status_alter_leasetenant_confirmed_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LandlordAnalyticsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city', models.CharField(max_length=100)),
+                ('state', models.CharField(max_length=2)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('inactive', 'Inactive'), ('no lease', 'No Lease')], max_length=10)),
+                ('property_count', models.IntegerField(default=0)),
+                ('active_lease_count', models.IntegerField(default=0)),
+                ('rent_sum', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('landlord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='rentapp.landlord')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('landlord', 'city', 'state', 'status'), name='unique_landlord_rollup_group')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1 on 2026-10-17 19:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('rentapp', '0004_landlordanalyticsrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='auth_user',
+            field=models.OneToOneField(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='rentapp_user',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
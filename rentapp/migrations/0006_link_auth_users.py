@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+def link_auth_users(apps, schema_editor):
+    """
+    Point every rentapp user at the auth user with the same email:
+    - Signup created both rows with username = email
+    - Users without one (never logged in since signup) get an auth user
+      carrying the password hash that was copied onto the rentapp row
+    """
+    User = apps.get_model('rentapp', 'User')
+    AuthUser = apps.get_model('auth', 'User')
+
+    auth_ids = dict(AuthUser.objects.values_list('username', 'id'))
+    missing = [
+        AuthUser(username=user.email, email=user.email, password=user.password or '!',
+                 first_name=user.first_name, last_name=user.last_name)
+        for user in User.objects.all() if user.email not in auth_ids
+    ]
+    for auth_user in AuthUser.objects.bulk_create(missing, batch_size=1000):
+        auth_ids[auth_user.username] = auth_user.id
+
+    users = list(User.objects.all())
+    for user in users:
+        user.auth_user_id = auth_ids[user.email]
+    User.objects.bulk_update(users, ['auth_user'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0005_user_auth_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_auth_users, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1 on 2026-10-17 19:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('rentapp', '0006_link_auth_users'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='password',
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='auth_user',
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='rentapp_user',
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.1 on 2026-10-17 19:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0007_remove_user_password_alter_user_auth_user'),
+    ]
+
+    # Composite indexes first, then drop the single-column indexes they make redundant
+    operations = [
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['property', 'status', 'monthly_rent'], name='lease_property_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leasetenant',
+            index=models.Index(fields=['tenant', 'lease', 'confirmed'], name='leasetenant_tenant_lease_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['landlord', 'property_name'], name='property_landlord_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['landlord', 'city', 'state'], name='property_landlord_city_idx'),
+        ),
+        migrations.AlterField(
+            model_name='lease',
+            name='property',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='rentapp.property'),
+        ),
+        migrations.AlterField(
+            model_name='leasetenant',
+            name='lease',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='rentapp.lease'),
+        ),
+        migrations.AlterField(
+            model_name='leasetenant',
+            name='tenant',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='rentapp.tenant'),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='landlord',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='rentapp.landlord'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1 on 2026-10-17 19:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_current_leases(apps, schema_editor):
+    """Same ranking as Lease.current_first: an active lease wins, ties go to the oldest"""
+    Property = apps.get_model('rentapp', 'Property')
+    Lease = apps.get_model('rentapp', 'Lease')
+
+    ranked = Lease.objects.filter(property=models.OuterRef('pk')).order_by(
+        models.Case(
+            models.When(status='active', then=models.Value(0)),
+            default=models.Value(1),
+            output_field=models.IntegerField()
+        ),
+        'lease_id'
+    )
+    Property.objects.update(
+        current_lease=models.Subquery(ranked.values('lease_id')[:1]),
+        current_lease_status=models.Subquery(ranked.values('status')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0008_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='current_lease',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='rentapp.lease'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='current_lease_status',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.RunPython(backfill_current_leases, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1 on 2026-10-17 19:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0009_property_current_lease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='landlord',
+            name='revised_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='landlord',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='revised_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='tenant',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
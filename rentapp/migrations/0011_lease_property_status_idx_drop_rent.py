@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-17 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rentapp', '0010_landlord_tenant_revision'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lease',
+            name='lease_property_status_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lease',
+            index=models.Index(fields=['property', 'status'], name='lease_property_status_idx'),
+        ),
+    ]
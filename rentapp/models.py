@@ -1,10 +1,17 @@
-from django.db import models
+from contextlib import contextmanager
+from decimal import Decimal
+from django.conf import settings
+from django.db import models, transaction, connection
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 
 class User(models.Model):
     user_id = models.AutoField(primary_key=True)
+    # Credentials live on the auth user; one joined lookup loads both (rentapp.backends)
+    auth_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='rentapp_user'
+    )
     email = models.EmailField(unique=True, db_index=True)
-    password = models.CharField(max_length=128)
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
     phone = models.CharField(max_length=20)
@@ -12,14 +19,35 @@ class User(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
 
-class Landlord(models.Model):
+class Revisioned(models.Model):
+    """
+    A change counter for everything a landlord's or tenant's pages show:
+    - Advanced in the write's transaction by the rentapp.cache invalidation hooks
+    - Loaded with the identity, so the API's ETag / Last-Modified cost no query
+    """
+    revision = models.PositiveBigIntegerField(default=0)
+    revised_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def advance(cls, ids):
+        """Bump the revision of the given rows in one UPDATE"""
+        ids = set(ids)
+        if ids:
+            cls.objects.filter(pk__in=ids).update(
+                revision=models.F('revision') + 1, revised_at=timezone.now()
+            )
+
+class Landlord(Revisioned):
     landlord_id = models.AutoField(primary_key=True)
     user = models.OneToOneField(User, on_delete=models.CASCADE)
 
     def __str__(self):
         return f"{self.user.first_name} {self.user.last_name}"
 
-class Tenant(models.Model):
+class Tenant(Revisioned):
     tenant_id = models.AutoField(primary_key=True)
     user = models.OneToOneField(User, on_delete=models.CASCADE)
 
@@ -29,7 +57,8 @@ class Tenant(models.Model):
 class Property(models.Model):
     property_id = models.AutoField(primary_key=True)
     property_name = models.CharField(max_length=200, unique=True)
-    landlord = models.ForeignKey(Landlord, on_delete=models.CASCADE, db_index=True)
+    # Indexed through the composite indexes below, which all lead with landlord
+    landlord = models.ForeignKey(Landlord, on_delete=models.CASCADE, db_index=False)
     address_line_1 = models.CharField(max_length=200)
     address_line_2 = models.CharField(max_length=200, blank=True)
     city = models.CharField(max_length=100, db_index=True)
@@ -38,12 +67,39 @@ class Property(models.Model):
     square_footage = models.IntegerField()
     bedrooms = models.IntegerField()
     bathrooms = models.DecimalField(max_digits=3, decimal_places=1)
+    # Denormalized current lease and its status, so read paths join one row instead of
+    # ranking the lease history; lease write paths keep them in step via refresh_current_leases
+    current_lease = models.ForeignKey(
+        'Lease', null=True, blank=True, on_delete=models.SET_NULL, related_name='+'
+    )
+    current_lease_status = models.CharField(max_length=10, null=True, blank=True)
 
     def __str__(self):
         return f"{self.address_line_1}, {self.city}, {self.state}"
 
+    @classmethod
+    def refresh_current_leases(cls, property_ids=None):
+        """
+        Re-point current_lease and current_lease_status in one UPDATE:
+        - Ranking is Lease.current_first; NULL when the property has no lease
+        - property_ids=None refreshes every property
+        - Returns the number of properties updated
+        """
+        ranked = Lease.current_first(models.OuterRef('pk'))
+        properties = cls.objects.all() if property_ids is None else cls.objects.filter(pk__in=property_ids)
+        return properties.update(
+            current_lease=models.Subquery(ranked.values('lease_id')[:1]),
+            current_lease_status=models.Subquery(ranked.values('status')[:1])
+        )
+
     class Meta:
         verbose_name_plural = "Properties"
+        indexes = [
+            # Dashboard and analytics pages: landlord's properties in keyset order
+            models.Index(fields=['landlord', 'property_name'], name='property_landlord_name_idx'),
+            # Analytics filters and rollup group refreshes
+            models.Index(fields=['landlord', 'city', 'state'], name='property_landlord_city_idx'),
+        ]
 
 class Lease(models.Model):
     STATUS_CHOICES = [
@@ -52,7 +108,8 @@ class Lease(models.Model):
     ]
 
     lease_id = models.AutoField(primary_key=True)
-    property = models.ForeignKey(Property, on_delete=models.CASCADE)
+    # Indexed through lease_property_status_idx
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, db_index=False)
     lease_start_date = models.DateField()
     lease_end_date = models.DateField()
     monthly_rent = models.DecimalField(
@@ -62,21 +119,76 @@ class Lease(models.Model):
     )
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='inactive', db_index=True)
 
+    class Meta:
+        indexes = [
+            # Ranks each property's leases (Lease.current_first) for
+            # Property.refresh_current_leases without scanning other properties
+            models.Index(fields=['property', 'status'], name='lease_property_status_idx'),
+        ]
+
     def __str__(self):
         return f"Lease for {self.property} ({self.status})"
         
+    @classmethod
+    def current_first(cls, property):
+        """A property's leases, current one first: an active lease wins, ties go to the oldest"""
+        return cls.objects.filter(property=property).order_by(
+            models.Case(
+                models.When(status='active', then=models.Value(0)),
+                default=models.Value(1),
+                output_field=models.IntegerField()
+            ),
+            'lease_id'
+        )
+
     def update_status(self):
-        """Update lease status based on tenant confirmations"""
-        lease_tenants = self.leasetenant_set.all()
-        if not lease_tenants.exists():
-            self.status = 'inactive'
-        else:
-            self.status = 'active' if all(lt.confirmed for lt in lease_tenants) else 'inactive'
-        self.save()
+        """
+        Update lease status based on tenant confirmations:
+        - One conditional aggregate for total and unconfirmed tenants
+        - One UPDATE that only matches when the status actually changes
+        - A change re-points the property's current lease and its rollup
+          group in the same transaction
+        - Returns True when the stored status changed
+        """
+        counts = self.leasetenant_set.aggregate(
+            total=models.Count('pk'),
+            unconfirmed=models.Count('pk', filter=models.Q(confirmed=False))
+        )
+        status = 'active' if counts['total'] and not counts['unconfirmed'] else 'inactive'
+        # No savepoint: inside a view's transaction this adds no statements
+        with transaction.atomic(savepoint=False):
+            changed = Lease.objects.filter(pk=self.pk).exclude(status=status).update(status=status)
+            if changed:
+                with LandlordAnalyticsRollup.tracking([self.property_id]):
+                    Property.refresh_current_leases([self.property_id])
+        self.status = status
+        return bool(changed)
+
+    @classmethod
+    def update_statuses(cls, leases):
+        """Recompute status for a queryset of leases in a single UPDATE, returns rows changed"""
+        tenants = LeaseTenant.objects.filter(lease=models.OuterRef('pk'))
+        status = models.Case(
+            models.When(
+                models.Exists(tenants) & ~models.Exists(tenants.filter(confirmed=False)),
+                then=models.Value('active')
+            ),
+            default=models.Value('inactive'),
+            output_field=models.CharField()
+        )
+        # Resolve affected properties first, the queryset may filter on status
+        property_ids = list(Property.objects.filter(lease__in=leases).values_list('pk', flat=True).distinct())
+        with transaction.atomic(savepoint=False):
+            changed = leases.exclude(status=status).update(status=status)
+            if changed:
+                with LandlordAnalyticsRollup.tracking(property_ids):
+                    Property.refresh_current_leases(property_ids)
+        return changed
 
 class LeaseTenant(models.Model):
-    lease = models.ForeignKey(Lease, on_delete=models.CASCADE, db_index=True)
-    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, db_index=True)
+    # Indexed through unique_lease_tenant and leasetenant_tenant_lease_idx
+    lease = models.ForeignKey(Lease, on_delete=models.CASCADE, db_index=False)
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, db_index=False)
     confirmed = models.BooleanField(default=False, db_index=True)
 
     class Meta:
@@ -86,6 +198,174 @@ class LeaseTenant(models.Model):
                 name='unique_lease_tenant'
             )
         ]
+        indexes = [
+            # Tenant access checks, tenant dashboard and accept/decline lookups,
+            # answered from the index including the confirmed flag
+            models.Index(fields=['tenant', 'lease', 'confirmed'], name='leasetenant_tenant_lease_idx'),
+        ]
 
     def __str__(self):
         return f"{self.tenant} - {self.lease}"
+
+class LandlordAnalyticsRollup(models.Model):
+    """Property count, active leases and rent per landlord, city, state and lease status"""
+    STATUS_CHOICES = Lease.STATUS_CHOICES + [
+        ('no lease', 'No Lease'),
+    ]
+
+    landlord = models.ForeignKey(Landlord, on_delete=models.CASCADE)
+    city = models.CharField(max_length=100)
+    state = models.CharField(max_length=2)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    property_count = models.IntegerField(default=0)
+    active_lease_count = models.IntegerField(default=0)
+    rent_sum = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['landlord', 'city', 'state', 'status'],
+                name='unique_landlord_rollup_group'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.landlord} - {self.city}, {self.state} ({self.status})"
+
+    @classmethod
+    def compute(cls, landlord_id=None, city=None, state=None):
+        """Aggregate groups from the raw property and lease tables (unsaved rows)"""
+        params = []
+        filter_conditions = []
+
+        if landlord_id is not None:
+            filter_conditions.append("p.landlord_id = %s")
+            params.append(landlord_id)
+        if city is not None:
+            filter_conditions.append("p.city = %s")
+            params.append(city)
+        if state is not None:
+            filter_conditions.append("p.state = %s")
+            params.append(state)
+
+        filter_sql = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+
+        with connection.cursor() as cursor:
+            # The current lease is the denormalized pointer on the property
+            cursor.execute(f"""
+                SELECT 
+                    p.landlord_id,
+                    p.city,
+                    p.state,
+                    COALESCE(p.current_lease_status, 'no lease') AS lease_status,
+                    COUNT(*),
+                    SUM(CASE WHEN p.current_lease_status = 'active' THEN 1 ELSE 0 END),
+                    COALESCE(SUM(CASE WHEN p.current_lease_status = 'active' THEN cl.monthly_rent END), 0)
+                FROM rentapp_property p
+                LEFT JOIN rentapp_lease cl ON cl.lease_id = p.current_lease_id
+                {filter_sql}
+                GROUP BY p.landlord_id, p.city, p.state, lease_status
+            """, params)
+
+            return [
+                cls(
+                    landlord_id=row[0],
+                    city=row[1],
+                    state=row[2],
+                    status=row[3],
+                    property_count=row[4],
+                    active_lease_count=row[5],
+                    rent_sum=Decimal(str(row[6])).quantize(Decimal('0.01'))
+                )
+                for row in cursor.fetchall()
+            ]
+
+    @classmethod
+    def contributions(cls, property_ids, lock=False):
+        """
+        What the given properties add to each (landlord, city, state, status) group,
+        as (property count, active lease count, rent sum); lock=True row-locks them
+        """
+        properties = Property.objects.filter(pk__in=property_ids).order_by('pk')
+        if lock:
+            # Only the property rows; the current lease is the nullable side of the join
+            properties = properties.select_for_update(of=('self',))
+        totals = {}
+        for landlord_id, city, state, status, rent in properties.values_list(
+            'landlord_id', 'city', 'state', 'current_lease_status', 'current_lease__monthly_rent'
+        ):
+            group = (landlord_id, city, state, status or 'no lease')
+            count, active, rent_sum = totals.get(group, (0, 0, Decimal('0')))
+            if status == 'active':
+                totals[group] = (count + 1, active + 1, rent_sum + Decimal(str(rent)))
+            else:
+                totals[group] = (count + 1, active, rent_sum)
+        return totals
+
+    @classmethod
+    def apply_changes(cls, before, after):
+        """
+        Add the difference between two contributions snapshots to the group rows:
+        - One F() expression UPDATE per changed group, whatever the group size
+        - Groups seen for the first time get a zero row first; emptied groups keep
+          a zero row, since deleting it could drop a concurrent writer's increment
+        """
+        zero = (0, 0, Decimal('0'))
+        deltas = {}
+        for group in before.keys() | after.keys():
+            delta = tuple(new - old for new, old in zip(after.get(group, zero), before.get(group, zero)))
+            if any(delta):
+                deltas[group] = delta
+
+        def add(group):
+            landlord_id, city, state, status = group
+            count, active, rent = deltas[group]
+            return cls.objects.filter(landlord_id=landlord_id, city=city, state=state, status=status).update(
+                property_count=models.F('property_count') + count,
+                active_lease_count=models.F('active_lease_count') + active,
+                rent_sum=models.F('rent_sum') + rent
+            )
+
+        # Sorted, so concurrent writers lock shared group rows in the same order
+        missing = [group for group in sorted(deltas) if not add(group)]
+        if missing:
+            # A concurrent writer may insert the same row first; the insert then waits
+            # for it to commit and does nothing, and the UPDATE adds to its row
+            cls.objects.bulk_create([
+                cls(landlord_id=landlord_id, city=city, state=state, status=status)
+                for landlord_id, city, state, status in missing
+            ], ignore_conflicts=True)
+            for group in missing:
+                add(group)
+
+    @classmethod
+    @contextmanager
+    def tracking(cls, property_ids=()):
+        """
+        Keep the rollup in step with a write to the given properties:
+        - Locks them and records their contributions before the write, so
+          concurrent writers of a property apply their deltas one at a time
+        - Applies the difference afterwards (apply_changes)
+        - Yields the tracked id set; add the ids of properties the write creates
+        Do not nest: an outer block would count the inner block's change again.
+        """
+        with transaction.atomic(savepoint=False):
+            tracked = set(property_ids)
+            before = cls.contributions(tracked, lock=True)
+            yield tracked
+            cls.apply_changes(before, cls.contributions(tracked))
+
+    @classmethod
+    def rebuild(cls):
+        """
+        Recompute every group from scratch:
+        - On PostgreSQL the table is locked against tracking() writers first:
+          writers that already applied a delta commit before compute() reads,
+          later ones wait and apply theirs on top, so none is lost
+        """
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(f'LOCK TABLE {cls._meta.db_table} IN SHARE ROW EXCLUSIVE MODE')
+            cls.objects.all().delete()
+            cls.objects.bulk_create(cls.compute(), batch_size=1000)
@@ -0,0 +1,80 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+
+CURSOR_PARAM = 'after'
+PAGE_SIZE_PARAM = 'page_size'
+
+
+def get_page_size(request):
+    """Requested page size, clamped to 1..RENTAPP_PAGE_SIZE_MAX"""
+    try:
+        size = int(request.GET.get(PAGE_SIZE_PARAM, settings.RENTAPP_PAGE_SIZE))
+    except ValueError:
+        size = settings.RENTAPP_PAGE_SIZE
+    return max(1, min(size, settings.RENTAPP_PAGE_SIZE_MAX))
+
+
+def encode_cursor(property_name, property_id):
+    payload = json.dumps([property_name, property_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(value):
+    """
+    The (property_name, property_id) a page starts after:
+    - None for the first page
+    - Malformed cursors also restart at the first page instead of erroring
+    """
+    if not value:
+        return None
+    try:
+        name, property_id = json.loads(base64.urlsafe_b64decode(value + '=' * (-len(value) % 4)))
+    except (ValueError, TypeError):
+        return None
+    if not isinstance(name, str) or not isinstance(property_id, int):
+        return None
+    return name, property_id
+
+
+def get_cursor(request):
+    return decode_cursor(request.GET.get(CURSOR_PARAM))
+
+
+def after_cursor(cursor, prefix=''):
+    """Q filter for rows strictly after the cursor in (property_name, property_id) order"""
+    if cursor is None:
+        return Q()
+    name, property_id = cursor
+    return Q(**{f'{prefix}property_name__gt': name}) | Q(
+        **{f'{prefix}property_name': name, f'{prefix}property_id__gt': property_id}
+    )
+
+
+def split_page(rows, page_size, key):
+    """
+    Rows were fetched with LIMIT page_size + 1:
+    - Returns the page and the cursor of the next one (None on the last page)
+    - key(row) gives the row's (property_name, property_id)
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(*key(rows[-1]))
+
+
+def page_links(request, next_cursor):
+    """Template context for next/first page links, keeping the other query parameters"""
+    def url(cursor):
+        params = request.GET.copy()
+        params.pop(CURSOR_PARAM, None)
+        if cursor:
+            params[CURSOR_PARAM] = cursor
+        return f'{request.path}?{params.urlencode()}' if params else request.path
+
+    return {
+        'next_page_url': url(next_cursor) if next_cursor else None,
+        'first_page_url': url(None) if get_cursor(request) else None,
+    }
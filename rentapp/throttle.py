@@ -0,0 +1,107 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def parse_rate(rate):
+    """'5/300' -> (capacity 5, refill 5 tokens per 300 seconds)"""
+    attempts, _, seconds = rate.partition('/')
+    return int(attempts), float(seconds)
+
+
+class LocalBuckets:
+    """Token buckets in this process; bounded LRU so random keys cannot grow it forever"""
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def take(self, key, capacity, period, now):
+        with self.lock:
+            tokens, updated = self.buckets.pop(key, (capacity, now))
+            tokens, allowed = _take(tokens, updated, capacity, period, now)
+            self.buckets[key] = (tokens, now)
+            while len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+            return allowed
+
+    def reset(self, key):
+        with self.lock:
+            self.buckets.pop(key, None)
+
+
+class CacheBuckets:
+    """
+    Token buckets in the configured Django cache, shared by every worker:
+    - Read-modify-write without a lock, so concurrent attempts may
+      occasionally both pass; good enough for brute-force throttling
+    """
+
+    def take(self, key, capacity, period, now):
+        tokens, updated = cache.get(key, (capacity, now))
+        tokens, allowed = _take(tokens, updated, capacity, period, now)
+        cache.set(key, (tokens, now), int(period) + 1)
+        return allowed
+
+    def reset(self, key):
+        cache.delete(key)
+
+
+def _take(tokens, updated, capacity, period, now):
+    tokens = min(capacity, tokens + (now - updated) * capacity / period)
+    if tokens < 1:
+        return tokens, False
+    return tokens - 1, True
+
+
+_local_buckets = LocalBuckets()
+
+
+def _buckets():
+    return CacheBuckets() if settings.LOGIN_THROTTLE_BACKEND == 'cache' else _local_buckets
+
+
+def client_ip(request):
+    """
+    Client address for throttling:
+    - Behind LOGIN_THROTTLE_PROXY_COUNT trusted proxies, the address the
+      outermost proxy saw (entries further left are client-controlled)
+    - Otherwise REMOTE_ADDR
+    """
+    proxies = settings.LOGIN_THROTTLE_PROXY_COUNT
+    forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+    if proxies and len(forwarded) >= proxies:
+        return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def _keys(request, email):
+    account = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+    return f'rentapp:throttle:account:{account}', f'rentapp:throttle:ip:{client_ip(request)}'
+
+
+def allow_login_attempt(request, email):
+    """
+    Take a token from the per-account bucket, then the per-IP bucket:
+    - Returns False once either is empty, before any user lookup or hash
+    - An attempt the account bucket rejects leaves the IP bucket alone, so
+      spraying one locked account cannot use up a shared NAT's allowance
+    - Buckets refill continuously at LOGIN_THROTTLE_ACCOUNT / LOGIN_THROTTLE_IP
+    """
+    account_key, ip_key = _keys(request, email)
+    buckets = _buckets()
+    now = time.time()
+    if not buckets.take(account_key, *parse_rate(settings.LOGIN_THROTTLE_ACCOUNT), now):
+        return False
+    return buckets.take(ip_key, *parse_rate(settings.LOGIN_THROTTLE_IP), now)
+
+
+def reset_login_attempts(request, email):
+    """A successful login clears the account bucket, typos before it are forgiven"""
+    account_key, _ = _keys(request, email)
+    _buckets().reset(account_key)
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 urlpatterns = [
     # Authentication URLs
@@ -10,7 +10,9 @@ urlpatterns = [
     # Landlord URLs
     path('landlord/dashboard/', views.landlord_dashboard, name='landlord_dashboard'),
     path('landlord/analytics/', views.landlord_analytics, name='landlord_analytics'),
+    path('landlord/analytics/export/<str:fmt>/', views.landlord_analytics_export, name='landlord_analytics_export'),
     path('landlord/property/create/', views.property_create, name='property_create'),
+    path('landlord/property/import/', views.property_import, name='property_import'),
     path('landlord/property/<int:property_id>/update/', views.property_update, name='property_update'),
     path('landlord/property/<int:property_id>/delete/', views.property_delete, name='property_delete'),
     path('landlord/property/<int:property_id>/add-lease/', views.add_lease_to_property, name='add_lease_to_property'),
@@ -30,6 +32,11 @@ urlpatterns = [
     path('tenant/<int:tenant_id>/<int:lease_id>/', views.tenant_details, name='tenant_details'),
     path('landlord/<int:landlord_id>/<int:property_id>/', views.landlord_details, name='landlord_details'),
 
+    # Read-only JSON API
+    path('api/v1/landlord/dashboard/', api.landlord_dashboard, name='api_landlord_dashboard'),
+    path('api/v1/tenant/dashboard/', api.tenant_dashboard, name='api_tenant_dashboard'),
+    path('api/v1/lease/<int:lease_id>/', api.lease_details, name='api_lease_details'),
+
     # Default landing page (redirect to login)
     path('', views.login_view, name='home'),
 ]
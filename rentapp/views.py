@@ -12,26 +12,54 @@
 # - Queries that are difficult to express in ORM
 # - When we need fine-grained control over the SQL
 
-from django.shortcuts import render, redirect, get_object_or_404
+# Read-only pages (dashboards and detail views) are async views:
+# - They use the async ORM and aget_identity() instead of request.identity
+# - Raw SQL helpers stay synchronous and are called through sync_to_async
+# - Everything a template touches is loaded up front, never lazily
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.shortcuts import render, redirect, get_object_or_404, aget_object_or_404
 from django.contrib import messages
 from django.contrib.auth import login, authenticate
 from django.contrib.auth.models import User as DjangoUser
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseForbidden
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, HttpResponseForbidden, StreamingHttpResponse
 from django.db import transaction, connection
+from django.utils.http import urlencode
 from functools import wraps
-from .forms import LeaseEditForm, PropertyForm, LeaseCreateForm
-from .models import User, Landlord, Tenant, Property, Lease, LeaseTenant
+import codecs
+from .forms import LeaseEditForm, PropertyForm, LeaseCreateForm, PortfolioImportForm
+from .importer import IMPORT_COLUMNS, import_portfolio
+from .exports import ENCODERS, afetch_chunks, astream, fetch_chunks, stream
+from .cache import cached, acached, invalidate_lease, invalidate_property
+from .middleware import aget_identity, forget_identity
+from .throttle import allow_login_attempt, reset_login_attempts
+from .pagination import after_cursor, get_cursor, get_page_size, page_links, split_page
+from .models import User, Landlord, Tenant, Property, Lease, LeaseTenant, LandlordAnalyticsRollup
 
 def login_required_with_role(view_func):
+    expected_role = view_func.__name__.split('_')[0]
+
+    def has_access(identity):
+        if not identity.is_authenticated:
+            return False
+        if expected_role in ['landlord', 'tenant']:
+            return identity.role == expected_role
+        return True
+
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def _wrapped_async_view(request, *args, **kwargs):
+            if not has_access(await aget_identity(request)):
+                return redirect('home')
+            return await view_func(request, *args, **kwargs)
+        return _wrapped_async_view
+
     @wraps(view_func)
     def _wrapped_view(request, *args, **kwargs):
-        if not request.session.get('user_id'):
+        if not has_access(request.identity):
             return redirect('home')
-        expected_role = view_func.__name__.split('_')[0]
-        if expected_role in ['landlord', 'tenant']:
-            if request.session.get('role') != expected_role:
-                return redirect('home')
         return view_func(request, *args, **kwargs)
     return _wrapped_view
 
@@ -44,44 +72,40 @@ def login_view(request):
             return redirect('landlord_dashboard')
         return redirect('tenant_dashboard')
     if request.method == 'POST':
-        email = request.POST.get('email')
-        password = request.POST.get('password')
+        email = request.POST.get('email', '')
+        password = request.POST.get('password', '')
         role = request.POST.get('role')
-        
-        try:
-            custom_user = User.objects.get(email=email)
-            # Get or create Django User for authentication
-            django_user, created = DjangoUser.objects.get_or_create(
-                username=email,
-                defaults={'email': email}
-            )
-            if created:
-                django_user.set_password(password)
-                django_user.save()
-            
-            # Authenticate with Django's auth system
-            user = authenticate(username=email, password=password)
-            if user is not None:
-                if role == 'landlord' and not hasattr(custom_user, 'landlord'):
-                    messages.error(request, 'No landlord account found for this user')
-                    return redirect('login')
-                elif role == 'tenant' and not hasattr(custom_user, 'tenant'):
-                    messages.error(request, 'No tenant account found for this user')
-                    return redirect('login')
-                
-                login(request, user)
-                request.session['user_id'] = str(custom_user.user_id)
-                request.session['role'] = role
-                
-                if role == 'landlord':
-                    return redirect('landlord_dashboard')
-                else:
-                    return redirect('tenant_dashboard')
-            else:
-                messages.error(request, 'Invalid credentials')
-                
-        except User.DoesNotExist:
+
+        # Rejected before any user lookup or password hash
+        if not allow_login_attempt(request, email):
+            messages.error(request, 'Too many login attempts. Please wait a few minutes and try again.')
+            return render(request, 'rentapp/login.html', status=429)
+
+        # One indexed lookup (auth user, profile and role rows) plus the hash check;
+        # unknown emails still pay for a dummy hash so timing does not reveal which
+        # accounts exist. No writes happen here unless an old hash is upgraded to
+        # the current work factor.
+        user = authenticate(request, username=email, password=password)
+        custom_user = getattr(user, 'rentapp_user', None)
+        if custom_user is None:
             messages.error(request, 'Invalid credentials')
+        elif role == 'landlord' and not hasattr(custom_user, 'landlord'):
+            messages.error(request, 'No landlord account found for this user')
+            return redirect('login')
+        elif role == 'tenant' and not hasattr(custom_user, 'tenant'):
+            messages.error(request, 'No tenant account found for this user')
+            return redirect('login')
+        else:
+            reset_login_attempts(request, email)
+            login(request, user)
+            forget_identity(request)
+            request.session['user_id'] = str(custom_user.user_id)
+            request.session['role'] = role
+
+            if role == 'landlord':
+                return redirect('landlord_dashboard')
+            else:
+                return redirect('tenant_dashboard')
             
     return render(request, 'rentapp/login.html')
 
@@ -95,8 +119,8 @@ def signup_view(request):
     if request.method == 'POST':
         email = request.POST['email']
         
-        # Check if user already exists
-        if DjangoUser.objects.filter(username=email).exists() or User.objects.filter(email=email).exists():
+        # Check if user already exists (every rentapp user has an auth user named after its email)
+        if DjangoUser.objects.filter(username=email).exists():
             messages.error(request, 'An account with this email already exists.')
             return render(request, 'rentapp/signup.html')
             
@@ -108,10 +132,10 @@ def signup_view(request):
                 password=request.POST['password']
             )
             
-            # Create custom user
+            # Profile row linked to it; the password hash is stored only once
             user = User.objects.create(
+                auth_user=django_user,
                 email=request.POST['email'],
-                password=django_user.password,  # Store hashed password
                 first_name=request.POST['first_name'],
                 last_name=request.POST['last_name'],
                 phone=request.POST['phone']
@@ -129,6 +153,7 @@ def signup_view(request):
             
             # Log the user in
             login(request, django_user)
+            forget_identity(request)
             
             # Set session variables
             request.session['user_id'] = str(user.user_id)
@@ -147,18 +172,56 @@ def logout_view(request):
     messages.info(request, 'You have been logged out.')
     return redirect('login')
 
+def tenant_dashboard_leases(tenant):
+    """
+    The tenant's lease cards in one joined SELECT:
+    - LeaseTenant, Lease and Property come back in the same row
+    - Only the columns tenant_dashboard.html reads are fetched
+    - Stable order so cards do not shuffle between requests
+    """
+    return LeaseTenant.objects.filter(tenant=tenant).select_related('lease__property').only(
+        'confirmed',
+        'lease__lease_id',
+        'lease__property__property_id',
+        'lease__property__property_name',
+        'lease__property__address_line_1',
+        'lease__property__address_line_2',
+        'lease__property__city',
+        'lease__property__state',
+        'lease__property__zip_code',
+    ).order_by('lease__property__property_name', 'lease_id')
+
 # Landlord Views
 @login_required_with_role
-def landlord_dashboard(request):
+async def landlord_dashboard(request):
     """Show landlord's properties and management options"""
-    if request.session.get('role') != 'landlord':
+    identity = await aget_identity(request)
+    if identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
-    user = User.objects.get(user_id=request.session['user_id'])
-    properties = Property.objects.filter(landlord=user.landlord)
+    landlord = identity.landlord
+    page_size = get_page_size(request)
+    cursor = get_cursor(request)
+
+    async def load_properties():
+        # Keyset page: seeks past the cursor instead of counting OFFSET rows
+        # current_lease_id/current_lease_status are columns of the property row
+        properties = Property.objects.filter(landlord=landlord).filter(
+            after_cursor(cursor)
+        ).order_by('property_name', 'property_id')[:page_size + 1]
+        return split_page(
+            [p async for p in properties], page_size, lambda p: (p.property_name, p.property_id)
+        )
+
+    # Keyed by revision too: cache versions live in each worker's cache, the revision in the database
+    properties, next_cursor = await acached(
+        'landlord_dashboard', [('landlord', landlord.landlord_id)], load_properties,
+        cursor, page_size, landlord.revision
+    )
     
     return render(request, 'rentapp/landlord_dashboard.html', {
-        'properties': properties
+        'properties': properties,
+        **page_links(request, next_cursor)
     })
 
 @login_required
@@ -170,16 +233,18 @@ def property_create(request):
     - Automatic SQL injection protection
     """
     """Create a new property"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
     if request.method == 'POST':
         form = PropertyForm(request.POST)
         if form.is_valid():
             property = form.save(commit=False)
-            user = User.objects.get(user_id=request.session['user_id'])
-            property.landlord = user.landlord
-            property.save()
+            property.landlord = request.identity.landlord
+            with LandlordAnalyticsRollup.tracking() as tracked:
+                property.save()
+                tracked.add(property.property_id)
+                invalidate_property(property)
             messages.success(request, 'Property created successfully')
             return redirect('landlord_dashboard')
     else:
@@ -187,15 +252,50 @@ def property_create(request):
         
     return render(request, 'rentapp/add_property.html', {'form': form})
 
-def get_landlord_analytics(landlord_id, city=None, state=None, status=None):
+@login_required
+def property_import(request):
+    """Bulk-import properties and optional leases from an uploaded CSV"""
+    if request.identity.role != 'landlord':
+        return HttpResponseForbidden("Landlord access only")
+
+    result = None
+    if request.method == 'POST':
+        form = PortfolioImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Large uploads are spooled to disk; decode and parse them line by line
+            lines = codecs.iterdecode(form.cleaned_data['csv_file'], 'utf-8-sig')
+            try:
+                result = import_portfolio(request.identity.landlord, lines)
+            except ValueError as e:
+                form.add_error('csv_file', str(e))
+            else:
+                if result.error_count:
+                    messages.warning(request, f'{result.error_count} rows were skipped')
+                messages.success(
+                    request, f'Imported {result.properties} properties and {result.leases} leases'
+                )
+    else:
+        form = PortfolioImportForm()
+
+    return render(request, 'rentapp/import_properties.html', {
+        'form': form,
+        'result': result,
+        'columns': IMPORT_COLUMNS
+    })
+
+# Columns of landlord_property_rows_sql, in SELECT order; also the export columns
+ANALYTICS_COLUMNS = [
+    'property_name', 'city', 'state', 'zip_code', 'lease_status', 'monthly_rent',
+    'lease_start_date', 'lease_end_date', 'property_id'
+]
+
+def landlord_property_rows_sql(landlord_id, city=None, state=None, status=None, after=None, limit=None):
     """
-    Complex analytics using prepared statements for:
-    - Dynamic filtering with parameterized queries
-    - Aggregations across multiple tables
-    - Custom joins and subqueries
-    - Performance optimization for large datasets
+    The landlord's property rows (ANALYTICS_COLUMNS) as a parameterized statement:
+    - Optional city / state / lease status filters
+    - Keyset paging: `limit` + 1 rows after the (property_name, property_id)
+      cursor `after`; the extra row tells whether there is a next page
     """
-    """Get analytics for a landlord using prepared statements with optional filters"""
     params = [landlord_id]
     filter_conditions = []
     
@@ -206,159 +306,163 @@ def get_landlord_analytics(landlord_id, city=None, state=None, status=None):
         filter_conditions.append("p.state = %s")
         params.append(state)
     if status:
-        if status == 'no lease':
-            filter_conditions.append("l.status IS NULL")
-        else:
-            filter_conditions.append("l.status = %s")
-            params.append(status)
+        filter_conditions.append("COALESCE(p.current_lease_status, 'no lease') = %s")
+        params.append(status)
+    if after:
+        filter_conditions.append("(p.property_name > %s OR (p.property_name = %s AND p.property_id > %s))")
+        params.extend([after[0], after[0], after[1]])
     
     filter_sql = " AND " + " AND ".join(filter_conditions) if filter_conditions else ""
+    limit_sql = ""
+    if limit:
+        limit_sql = " LIMIT %s"
+        params.append(limit + 1)
     
+    # Current lease per property (the active one if any, else the oldest) is kept
+    # on the property row, so this is one primary-key join per property
+    return f"""
+        SELECT 
+            p.property_name,
+            p.city,
+            p.state,
+            p.zip_code,
+            COALESCE(p.current_lease_status, 'no lease') AS lease_status,
+            cl.monthly_rent,
+            cl.lease_start_date,
+            cl.lease_end_date,
+            p.property_id
+        FROM rentapp_property p
+        LEFT JOIN rentapp_lease cl ON cl.lease_id = p.current_lease_id
+        WHERE p.landlord_id = %s{filter_sql}
+        ORDER BY p.property_name, p.property_id{limit_sql}
+    """, params
+
+def get_landlord_analytics(landlord_id, city=None, state=None, status=None, after=None, limit=None):
+    """
+    Complex analytics using prepared statements for:
+    - Totals and filter facets read from the per-group rollup table
+    - Dynamic filtering with parameterized queries (landlord_property_rows_sql)
+    - Keyset paging of the property table: `limit` rows after the
+      (property_name, property_id) cursor `after`, plus the next cursor
+    """
+    """Get analytics for a landlord using prepared statements with optional filters"""
+    total_properties = 0
+    active_leases = 0
+    monthly_income = 0
+    filtered_count = 0
+    filtered_rent = 0
+    cities, states, statuses = set(), set(), set()
+
+    # O(number of groups) rows instead of the whole portfolio; emptied groups keep a zero row
+    for group in LandlordAnalyticsRollup.objects.filter(landlord_id=landlord_id, property_count__gt=0):
+        total_properties += group.property_count
+        active_leases += group.active_lease_count
+        monthly_income += group.rent_sum
+        cities.add(group.city)
+        states.add(group.state)
+        statuses.add(group.status)
+        if ((not city or group.city == city) and (not state or group.state == state)
+                and (not status or group.status == status)):
+            filtered_count += group.property_count
+            filtered_rent += group.rent_sum
+
+    sql, params = landlord_property_rows_sql(landlord_id, city, state, status, after, limit)
     with connection.cursor() as cursor:
-        # Get total properties and average rent for filtered results
-        cursor.execute(f"""
-            SELECT 
-                COUNT(*),
-                COALESCE(AVG(CASE WHEN l.monthly_rent IS NOT NULL THEN l.monthly_rent END), 0)
-            FROM rentapp_property p
-            LEFT JOIN (
-                SELECT property_id, status, monthly_rent
-                FROM rentapp_lease
-                WHERE status = 'active'
-                OR (status = 'inactive' AND property_id NOT IN (
-                    SELECT property_id FROM rentapp_lease WHERE status = 'active'
-                ))
-            ) l ON p.property_id = l.property_id
-            WHERE p.landlord_id = %s{filter_sql}
-        """, params)
-        filtered_count, avg_rent = cursor.fetchone()
-
-        # Get total properties (unfiltered)
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM rentapp_property 
-            WHERE landlord_id = %s
-        """, [landlord_id])
-        total_properties = cursor.fetchone()[0]
+        cursor.execute(sql, params)
+        properties = [dict(zip(ANALYTICS_COLUMNS, row)) for row in cursor.fetchall()]
 
-        # Get properties with active leases (unfiltered)
-        cursor.execute("""
-            SELECT COUNT(DISTINCT p.property_id)
-            FROM rentapp_property p
-            JOIN rentapp_lease l ON p.property_id = l.property_id
-            WHERE p.landlord_id = %s AND l.status = 'active'
-        """, [landlord_id])
-        active_leases = cursor.fetchone()[0]
-
-        # Get total monthly income from active leases (unfiltered)
-        cursor.execute("""
-            SELECT COALESCE(SUM(l.monthly_rent), 0)
-            FROM rentapp_property p
-            JOIN rentapp_lease l ON p.property_id = l.property_id
-            WHERE p.landlord_id = %s AND l.status = 'active'
-        """, [landlord_id])
-        monthly_income = cursor.fetchone()[0]
-
-        # Get property details with lease status (filtered)
-        cursor.execute(f"""
-            SELECT 
-                p.property_name,
-                p.city,
-                p.state,
-                p.zip_code,
-                CASE 
-                    WHEN l.status IS NULL THEN 'no lease'
-                    ELSE l.status 
-                END as lease_status,
-                l.monthly_rent
-            FROM rentapp_property p
-            LEFT JOIN (
-                SELECT property_id, status, monthly_rent
-                FROM rentapp_lease
-                WHERE status = 'active'
-                OR (status = 'inactive' AND property_id NOT IN (
-                    SELECT property_id FROM rentapp_lease WHERE status = 'active'
-                ))
-            ) l ON p.property_id = l.property_id
-            WHERE p.landlord_id = %s{filter_sql}
-            ORDER BY p.property_name
-        """, params)
-        
-        properties = [
-            {
-                'property_name': row[0],
-                'city': row[1],
-                'state': row[2],
-                'zip_code': row[3],
-                'lease_status': row[4],
-                'monthly_rent': row[5]
-            }
-            for row in cursor.fetchall()
-        ]
+    next_cursor = None
+    if limit:
+        properties, next_cursor = split_page(
+            properties, limit, lambda p: (p['property_name'], p['property_id'])
+        )
 
     return {
         'total_properties': total_properties,
         'active_leases': active_leases,
         'monthly_income': monthly_income,
-        'properties': properties
+        'properties': properties,
+        'next_cursor': next_cursor,
+        'filtered_count': filtered_count,
+        'avg_rent': filtered_rent / filtered_count if filtered_count else 0,
+        'unique_cities': sorted(cities),
+        'unique_states': sorted(states),
+        'unique_statuses': sorted(statuses)
     }
 
 @login_required
 def landlord_analytics(request):
     """View analytics dashboard for landlord"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
-    user = User.objects.get(user_id=request.session['user_id'])
+    identity = request.identity
     
     # Get filter parameters
     city = request.GET.get('city', '')
     state = request.GET.get('state', '')
     status = request.GET.get('status', '')
+    page_size = get_page_size(request)
+    cursor = get_cursor(request)
     
-    # Get analytics with filters
-    analytics = get_landlord_analytics(
-        str(user.landlord.landlord_id),
-        city=city if city else None,
-        state=state if state else None,
-        status=status if status else None
+    # Get analytics and filter facets with filters
+    landlord_id = identity.landlord.landlord_id
+    analytics = cached(
+        'landlord_analytics', [('landlord', landlord_id)],
+        lambda: get_landlord_analytics(
+            str(landlord_id),
+            city=city if city else None,
+            state=state if state else None,
+            status=status if status else None,
+            after=cursor,
+            limit=page_size
+        ),
+        city, state, status, cursor, page_size, identity.landlord.revision
     )
     
-    # Get all possible values for filters (unfiltered)
-    with connection.cursor() as cursor:
-        cursor.execute("""
-            SELECT DISTINCT city, state,
-                   CASE 
-                       WHEN l.status IS NULL THEN 'no lease'
-                       ELSE l.status 
-                   END as lease_status
-            FROM rentapp_property p
-            LEFT JOIN rentapp_lease l ON p.property_id = l.property_id
-            WHERE p.landlord_id = %s
-        """, [user.landlord.landlord_id])
-        
-        filter_values = cursor.fetchall()
-        unique_cities = sorted(set(row[0] for row in filter_values))
-        unique_states = sorted(set(row[1] for row in filter_values))
-        unique_statuses = sorted(set(row[2] for row in filter_values))
-    
     analytics.update({
-        'unique_cities': unique_cities,
-        'unique_states': unique_states,
-        'unique_statuses': unique_statuses,
-        'filtered_count': len(analytics['properties']),
-        'avg_rent': sum((p['monthly_rent'] if p['lease_status'] == 'active' else 0) for p in analytics['properties']) / len(analytics['properties']) if analytics['properties'] else 0,
         'selected_city': city,
         'selected_state': state,
-        'selected_status': status
+        'selected_status': status,
+        'export_query': urlencode({key: value for key, value in [('city', city), ('state', state), ('status', status)] if value}),
+        **page_links(request, analytics['next_cursor'])
     })
     
     return render(request, 'rentapp/landlord_analytics.html', analytics)
 
+@login_required
+def landlord_analytics_export(request, fmt):
+    """
+    Stream the landlord's filtered analytics rows (the rent roll) as CSV or JSON:
+    - Same rows and filters as the analytics page, all pages at once
+    - Rows come from a chunked cursor, so memory stays flat for any portfolio
+      and the header is sent before the query runs
+    """
+    if request.identity.role != 'landlord':
+        return HttpResponseForbidden("Landlord access only")
+    if fmt not in ENCODERS:
+        raise Http404("Unknown export format")
+
+    sql, params = landlord_property_rows_sql(
+        str(request.identity.landlord.landlord_id),
+        city=request.GET.get('city') or None,
+        state=request.GET.get('state') or None,
+        status=request.GET.get('status') or None
+    )
+    encoder = ENCODERS[fmt](ANALYTICS_COLUMNS)
+    # Under ASGI a sync iterator would be consumed whole before sending
+    if isinstance(request, ASGIRequest):
+        content = astream(encoder, afetch_chunks(sql, params))
+    else:
+        content = stream(encoder, fetch_chunks(sql, params))
+    response = StreamingHttpResponse(content, content_type=encoder.content_type)
+    response['Content-Disposition'] = f'attachment; filename="rent-roll.{fmt}"'
+    return response
+
 @login_required
 def property_update(request, property_id):
     """Update existing property details"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
     
     with transaction.atomic():
@@ -366,17 +470,18 @@ def property_update(request, property_id):
             Property.objects.select_for_update(),
             property_id=property_id
         )
-        user = User.objects.get(user_id=request.session['user_id'])
+        identity = request.identity
         
-        if property.landlord != user.landlord:
+        if not identity.owns(property):
             return HttpResponseForbidden("Not your property")
             
     if request.method == 'POST':
         form = PropertyForm(request.POST, instance=property)
         if form.is_valid():
-            with transaction.atomic():
-                property = Property.objects.select_for_update().get(pk=property_id)
+            # Moves the property between rollup groups when its city or state changes
+            with LandlordAnalyticsRollup.tracking([property_id]):
                 form.save()
+                invalidate_property(property)
                 messages.success(request, 'Property updated successfully')
                 return redirect('landlord_dashboard')
     else:
@@ -390,29 +495,31 @@ def property_update(request, property_id):
 @login_required
 def property_delete(request, property_id):
     """Delete a property"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
     property = get_object_or_404(Property, property_id=property_id)
-    user = User.objects.get(user_id=request.session['user_id'])
+    identity = request.identity
     
-    if property.landlord != user.landlord:
+    if not identity.owns(property):
         return HttpResponseForbidden("Not your property")
         
-    property.delete()
+    with LandlordAnalyticsRollup.tracking([property_id]):
+        invalidate_property(property)
+        property.delete()
     messages.success(request, 'Property deleted successfully')
     return redirect('landlord_dashboard')
 
 @login_required
 def add_lease_to_property(request, property_id):
     """Add new lease with multiple tenants to property"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
     property = get_object_or_404(Property, property_id=property_id)
-    user = User.objects.get(user_id=request.session['user_id'])
+    identity = request.identity
     
-    if property.landlord != user.landlord:
+    if not identity.owns(property):
         return HttpResponseForbidden("Not your property")
         
     if request.method == 'POST':
@@ -425,15 +532,16 @@ def add_lease_to_property(request, property_id):
                     lease.status = 'inactive'
                     lease.save()
                     
-                    tenant_emails = form.cleaned_data['tenant_emails']
-                    for email in tenant_emails:
-                        tenant = Tenant.objects.get(user__email=email)
-                        LeaseTenant.objects.create(
-                            lease=lease,
-                            tenant=tenant,
-                            confirmed=False
-                        )
-                    lease.update_status()
+                    # Tenants were resolved in one query during form validation
+                    LeaseTenant.objects.bulk_create([
+                        LeaseTenant(lease=lease, tenant=tenant, confirmed=False)
+                        for tenant in form.tenants
+                    ])
+                    invalidate_lease(property.landlord_id, lease.lease_id)
+                    # The property gains a lease even when the status stays inactive
+                    if not lease.update_status():
+                        with LandlordAnalyticsRollup.tracking([property.property_id]):
+                            Property.refresh_current_leases([property.property_id])
                     messages.success(request, 'Lease created successfully')
                     return redirect('landlord_dashboard')
             except Exception as e:
@@ -445,13 +553,20 @@ def add_lease_to_property(request, property_id):
 
 # Tenant Views
 @login_required
-def tenant_dashboard(request):
+async def tenant_dashboard(request):
     """Show tenant's rented properties"""
-    if request.session.get('role') != 'tenant':
+    identity = await aget_identity(request)
+    if identity.role != 'tenant':
         return HttpResponseForbidden("Tenant access only")
         
-    user = User.objects.get(user_id=request.session['user_id'])
-    lease_tenants = LeaseTenant.objects.filter(tenant=user.tenant)
+    tenant = identity.tenant
+
+    async def load_lease_tenants():
+        return [lt async for lt in tenant_dashboard_leases(tenant)]
+
+    lease_tenants = await acached(
+        'tenant_dashboard', [('tenant', tenant.tenant_id)], load_lease_tenants, tenant.revision
+    )
     
     return render(request, 'rentapp/tenant_dashboard.html', {
         'lease_tenants': lease_tenants
@@ -460,24 +575,25 @@ def tenant_dashboard(request):
 @login_required
 def accept_lease(request, lease_id):
     """Accept a pending lease invitation"""
-    if request.session.get('role') != 'tenant':
+    if request.identity.role != 'tenant':
         return HttpResponseForbidden("Tenant access only")
         
     if request.method != 'POST':
         return HttpResponseForbidden("Invalid request method")
     
     with transaction.atomic():
-        user = User.objects.get(user_id=request.session['user_id'])
+        identity = request.identity
         lease_tenant = get_object_or_404(
             LeaseTenant.objects.select_for_update(),
             lease__lease_id=lease_id,
-            tenant=user.tenant,
+            tenant=identity.tenant,
             confirmed=False
         )
         
         # Lock the related lease to prevent concurrent status updates
-        lease = Lease.objects.select_for_update().get(pk=lease_tenant.lease.pk)
+        lease = Lease.objects.select_for_update().select_related('property').get(pk=lease_tenant.lease_id)
         
+        invalidate_lease(lease.property.landlord_id, lease.lease_id)
         lease_tenant.confirmed = True
         lease_tenant.save()
         lease.update_status()
@@ -488,46 +604,52 @@ def accept_lease(request, lease_id):
 @login_required
 def decline_lease(request, lease_id):
     """Decline a pending lease invitation"""
-    if request.session.get('role') != 'tenant':
+    if request.identity.role != 'tenant':
         return HttpResponseForbidden("Tenant access only")
         
     if request.method != 'POST':
         return HttpResponseForbidden("Invalid request method")
         
-    user = User.objects.get(user_id=request.session['user_id'])
-    lease_tenant = get_object_or_404(
-        LeaseTenant,
-        lease__lease_id=lease_id,
-        tenant=user.tenant,
-        confirmed=False
-    )
+    # Cache versions are bumped on commit, after the delete is visible
+    with transaction.atomic():
+        identity = request.identity
+        lease_tenant = get_object_or_404(
+            LeaseTenant.objects.select_for_update(),
+            lease__lease_id=lease_id,
+            tenant=identity.tenant,
+            confirmed=False
+        )
+        
+        # Lock the lease to prevent concurrent status updates
+        lease = Lease.objects.select_for_update().select_related('property').get(pk=lease_tenant.lease_id)
+        invalidate_lease(lease.property.landlord_id, lease.lease_id)
+        lease_tenant.delete()
+        lease.update_status()
     
-    lease = lease_tenant.lease
-    lease_tenant.delete()
-    lease.update_status()
     messages.success(request, 'Lease declined successfully')
     return redirect('tenant_dashboard')
 
 @login_required
 def break_lease(request, lease_id):
     """Break an active lease"""
-    if request.session.get('role') != 'tenant':
+    if request.identity.role != 'tenant':
         return HttpResponseForbidden("Tenant access only")
         
     if request.method != 'POST':
         return HttpResponseForbidden("Invalid request method")
     
     with transaction.atomic():
-        user = User.objects.get(user_id=request.session['user_id'])
+        identity = request.identity
         lease_tenant = get_object_or_404(
             LeaseTenant.objects.select_for_update(),
             lease__lease_id=lease_id,
-            tenant=user.tenant,
+            tenant=identity.tenant,
             confirmed=True
         )
         
         # Lock the lease to prevent concurrent status updates
-        lease = Lease.objects.select_for_update().get(pk=lease_tenant.lease.pk)
+        lease = Lease.objects.select_for_update().select_related('property').get(pk=lease_tenant.lease_id)
+        invalidate_lease(lease.property.landlord_id, lease.lease_id)
         lease_tenant.delete()
         lease.update_status()
     
@@ -536,121 +658,123 @@ def break_lease(request, lease_id):
 
 # Shared Views
 @login_required
-def view_lease_details(request, lease_id):
+async def view_lease_details(request, lease_id):
+    """View lease details for both landlord and tenant"""
+    identity = await aget_identity(request)
+    context = await sync_to_async(get_lease_details)(identity, lease_id)
+    if isinstance(context, HttpResponse):
+        return context
+    context['user'] = identity.user
+    return render(request, 'rentapp/lease_details.html', context)
+
+def lease_access_sql(identity, lease_id_column):
     """
-    Hybrid approach using both prepared statements and ORM:
-    - Prepared statements for complex authorization checks
-    - Raw SQL for efficient data retrieval across multiple tables
-    - Demonstrates when to choose each approach based on the query needs
+    SQL predicate (and params) for "identity may see the lease in lease_id_column":
+    - Landlords see leases on properties they own
+    - Tenants see leases they are on
+    Folded into the data query, so a denied request simply returns no rows
     """
-    """View lease details for both landlord and tenant"""
-    user = User.objects.get(user_id=request.session['user_id'])
-    
+    if identity.role == 'landlord':
+        return f"""EXISTS (
+            SELECT 1
+            FROM rentapp_lease al
+            JOIN rentapp_property ap ON al.property_id = ap.property_id
+            WHERE al.lease_id = {lease_id_column} AND ap.landlord_id = %s
+        )""", [identity.landlord.landlord_id]
+    return f"""EXISTS (
+        SELECT 1
+        FROM rentapp_leasetenant alt
+        WHERE alt.lease_id = {lease_id_column} AND alt.tenant_id = %s
+    )""", [identity.tenant.tenant_id]
+
+def get_lease_details(identity, lease_id):
+    """
+    Prepared statement that authorizes and fetches in one round trip:
+    - The lease row joined with every tenant on it (one row per tenant)
+    - No rows at all when the lease is missing or not the caller's
+    - The caller's own confirmation comes from the same rows
+    Returns the template context, or a forbidden response
+    """
+    access_sql, access_params = lease_access_sql(identity, 'l.lease_id')
     with connection.cursor() as cursor:
-        # First check authorization
-        if request.session.get('role') == 'landlord':
-            # Check if landlord owns the property this lease is for
-            cursor.execute("""
-                SELECT 1
-                FROM rentapp_lease l
-                JOIN rentapp_property p ON l.property_id = p.property_id
-                WHERE l.lease_id = %s AND p.landlord_id = %s
-            """, [lease_id, user.landlord.landlord_id])
-            if not cursor.fetchone():
-                return HttpResponseForbidden("Not your property's lease")
-        else:  # tenant
-            # Check if tenant is part of this lease
-            cursor.execute("""
-                SELECT 1
-                FROM rentapp_leasetenant lt
-                WHERE lt.lease_id = %s AND lt.tenant_id = %s
-            """, [lease_id, user.tenant.tenant_id])
-            if not cursor.fetchone():
-                return HttpResponseForbidden("Not your lease")
-
-        # Get lease details
-        cursor.execute("""
-            SELECT l.lease_id, l.lease_start_date, l.lease_end_date, 
-                   l.monthly_rent, l.status, l.property_id
+        cursor.execute(f"""
+            SELECT l.lease_id, l.lease_start_date, l.lease_end_date,
+                   l.monthly_rent, l.status, l.property_id,
+                   u.email, lt.confirmed, lt.tenant_id
             FROM rentapp_lease l
-            WHERE l.lease_id = %s
-        """, [lease_id])
-        
-        row = cursor.fetchone()
-        if not row:
-            return HttpResponseForbidden("Lease not found")
-            
-        lease_dict = {
-            'lease_id': row[0],
-            'lease_start_date': row[1],
-            'lease_end_date': row[2],
-            'monthly_rent': row[3],
-            'status': row[4],
-            'property_id': row[5]
-        }
-        
-        # Get lease tenants
-        cursor.execute("""
-            SELECT u.email, lt.confirmed, lt.tenant_id
-            FROM rentapp_leasetenant lt
-            JOIN rentapp_tenant t ON lt.tenant_id = t.tenant_id
-            JOIN rentapp_user u ON t.user_id = u.user_id
-            WHERE lt.lease_id = %s
-        """, [lease_id])
-        
-        lease_tenants = [
-            {'email': row[0], 'confirmed': row[1], 'tenant_id': row[2]}
-            for row in cursor.fetchall()
-        ]
-        
-        if request.session.get('role') == 'landlord':
-            context = {
-                'lease': lease_dict,
-                'lease_tenants': lease_tenants
-            }
-        else:  # tenant
-            # Get tenant's confirmation status
-            cursor.execute("""
-                SELECT lt.confirmed
-                FROM rentapp_leasetenant lt
-                WHERE lt.lease_id = %s AND lt.tenant_id = %s
-            """, [lease_id, user.tenant.tenant_id])
-            
-            tenant_row = cursor.fetchone()
-            context = {
-                'lease': lease_dict,
-                'lease_tenant': {'confirmed': tenant_row[0]},
-                'lease_tenants': lease_tenants
-            }
-    
-    return render(request, 'rentapp/lease_details.html', context)
+            LEFT JOIN rentapp_leasetenant lt ON lt.lease_id = l.lease_id
+            LEFT JOIN rentapp_tenant t ON lt.tenant_id = t.tenant_id
+            LEFT JOIN rentapp_user u ON t.user_id = u.user_id
+            WHERE l.lease_id = %s AND {access_sql}
+            ORDER BY lt.id
+        """, [lease_id, *access_params])
+        rows = cursor.fetchall()
+
+    if not rows:
+        if identity.role == 'landlord':
+            return HttpResponseForbidden("Not your property's lease")
+        return HttpResponseForbidden("Not your lease")
+
+    row = rows[0]
+    lease_dict = {
+        'lease_id': row[0],
+        'lease_start_date': row[1],
+        'lease_end_date': row[2],
+        'monthly_rent': row[3],
+        'status': row[4],
+        'property_id': row[5]
+    }
+    lease_tenants = [
+        {'email': row[6], 'confirmed': row[7], 'tenant_id': row[8]}
+        for row in rows if row[8] is not None
+    ]
+    context = {
+        'lease': lease_dict,
+        'lease_tenants': lease_tenants
+    }
+    if identity.role == 'tenant':
+        context['lease_tenant'] = next(
+            {'confirmed': lt['confirmed']} for lt in lease_tenants
+            if lt['tenant_id'] == identity.tenant.tenant_id
+        )
+    return context
 
-def property_details(request, property_id):
+@login_required_with_role
+async def property_details(request, property_id):
     """View property details (different views for landlord/tenant)"""
-    property = get_object_or_404(Property, property_id=property_id)
-    user = User.objects.get(user_id=request.session['user_id'])
-    role = request.session.get('role')
+    identity = await aget_identity(request)
+    # Property changes advance its landlord's and tenants' revisions
+    property = await acached(
+        'property_details', [('property', property_id)],
+        lambda: aget_object_or_404(Property.objects.select_related('landlord__user'), property_id=property_id),
+        identity.revision
+    )
+    role = identity.role
     
     if role == 'landlord':
-        if property.landlord != user.landlord:
+        if not identity.owns(property):
             return HttpResponseForbidden("Not your property")
         context = {'property': property}
     else:  # tenant
         # Check if tenant has a lease for this property
-        lease_exists = LeaseTenant.objects.filter(
-            tenant=user.tenant,
-            lease__property=property
-        ).exists()
+        tenant = identity.tenant
+        lease_exists = await acached(
+            'property_access', [('tenant', tenant.tenant_id)],
+            lambda: LeaseTenant.objects.filter(tenant=tenant, lease__property=property).aexists(),
+            property_id, tenant.revision
+        )
         if not lease_exists:
             return HttpResponseForbidden("You don't have a lease for this property")
         context = {'property': property}
     
+    # The template compares against user.email; skip the lazy auth user
+    context['user'] = identity.user
     return render(request, 'rentapp/property_details.html', context)
 
 @login_required
 def edit_lease(request, property_id):
     """Edit existing lease and tenant list with improved error handling and data persistence"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
     
     with transaction.atomic():
@@ -658,13 +782,14 @@ def edit_lease(request, property_id):
             Property.objects.select_for_update(),
             property_id=property_id
         )
-        user = User.objects.get(user_id=request.session['user_id'])
+        identity = request.identity
         
-        if property.landlord != user.landlord:
+        if not identity.owns(property):
             return HttpResponseForbidden("Not your property")
             
         lease = get_object_or_404(
             Lease.objects.select_for_update(),
+            pk=property.current_lease_id,
             property=property
         )
     
@@ -674,27 +799,28 @@ def edit_lease(request, property_id):
         if form.is_valid():
             try:
                 with transaction.atomic():
-                    # Save lease details
-                    form.save()
+                    # Save lease details; a new rent changes the rollup even without a status change
+                    with LandlordAnalyticsRollup.tracking([property.property_id]):
+                        form.save()
                     
-                    # Process tenants
-                    new_tenant_emails = form.cleaned_data['tenant_emails']
-                    current_tenants = lease.leasetenant_set.all()
+                    # Removed tenants must see the change too, so invalidate before and after
+                    invalidate_lease(property.landlord_id, lease.lease_id)
                     
-                    # Remove tenants not in new list
-                    for lease_tenant in current_tenants:
-                        if lease_tenant.tenant.user.email not in new_tenant_emails:
-                            lease_tenant.delete()
+                    # Process tenants as a set difference: one DELETE, one INSERT
+                    new_tenant_ids = [tenant.tenant_id for tenant in form.tenants]
                     
-                    # Add new tenants
-                    for email in new_tenant_emails:
-                        tenant = Tenant.objects.get(user__email=email)
-                        LeaseTenant.objects.get_or_create(
-                            lease=lease,
-                            tenant=tenant,
-                            defaults={'confirmed': False}
-                        )
+                    # Remove tenants not in new list
+                    lease.leasetenant_set.exclude(tenant_id__in=new_tenant_ids).delete()
                     
+                    # Add new tenants, keeping existing rows (and confirmations) via unique_lease_tenant
+                    LeaseTenant.objects.bulk_create(
+                        [
+                            LeaseTenant(lease=lease, tenant=tenant, confirmed=False)
+                            for tenant in form.tenants
+                        ],
+                        ignore_conflicts=True
+                    )
+                    invalidate_lease(property.landlord_id, lease.lease_id)
                     lease.update_status()
                     messages.success(request, 'Lease updated successfully')
                     return redirect('landlord_dashboard')
@@ -712,7 +838,7 @@ def edit_lease(request, property_id):
 @login_required
 def cancel_lease(request, property_id):
     """Cancel/delete an existing lease"""
-    if request.session.get('role') != 'landlord':
+    if request.identity.role != 'landlord':
         return HttpResponseForbidden("Landlord access only")
         
     if request.method == 'POST':
@@ -721,17 +847,20 @@ def cancel_lease(request, property_id):
                 Property.objects.select_for_update(),
                 property_id=property_id
             )
-            user = User.objects.get(user_id=request.session['user_id'])
+            identity = request.identity
             
-            if property.landlord != user.landlord:
+            if not identity.owns(property):
                 return HttpResponseForbidden("Not your property")
             
             try:
-                lease = Lease.objects.select_for_update().get(property=property)
-                # Delete all associated lease tenants first
-                LeaseTenant.objects.filter(lease=lease).delete()
-                # Then delete the lease
-                lease.delete()
+                lease = Lease.objects.select_for_update().get(pk=property.current_lease_id, property=property)
+                invalidate_lease(property.landlord_id, lease.lease_id)
+                with LandlordAnalyticsRollup.tracking([property.property_id]):
+                    # Delete all associated lease tenants first
+                    LeaseTenant.objects.filter(lease=lease).delete()
+                    # Then delete the lease; the next lease in line (if any) becomes current
+                    lease.delete()
+                    Property.refresh_current_leases([property.property_id])
                 messages.success(request, 'Lease cancelled successfully')
             except Lease.DoesNotExist:
                 messages.error(request, 'No lease found for this property')
@@ -739,21 +868,18 @@ def cancel_lease(request, property_id):
     
     return HttpResponseForbidden("Invalid request method")
 
+@login_required_with_role
 def user_profile(request):
     """View/edit user profile"""
-    user = User.objects.get(user_id=request.session['user_id'])
-    role = request.session.get('role')
+    user = request.identity.user
+    role = request.identity.role
     
     if request.method == 'POST':
         user.first_name = request.POST['first_name']
         user.last_name = request.POST['last_name']
         user.phone = request.POST['phone']
-        user.save()
-        
-        if role == 'landlord':
-            user.landlord.save()
-        elif role == 'tenant':
-            user.tenant.save()
+        user.save(update_fields=['first_name', 'last_name', 'phone'])
+        forget_identity(request)
             
         messages.success(request, 'Profile updated successfully')
         return redirect('user_profile')
@@ -764,116 +890,96 @@ def user_profile(request):
     })
 
 @login_required
-def tenant_details(request, tenant_id, lease_id):
+async def tenant_details(request, tenant_id, lease_id):
     """View tenant details with proper authorization"""
-    user = User.objects.get(user_id=request.session['user_id'])
-    role = request.session.get('role')
+    identity = await aget_identity(request)
+    context = await sync_to_async(get_tenant_details)(identity, tenant_id, lease_id)
+    if isinstance(context, HttpResponse):
+        return context
+    return render(request, 'rentapp/tenant_details.html', context)
 
+def get_tenant_details(identity, tenant_id, lease_id):
+    """
+    Tenant details template context, or a forbidden response:
+    - One statement: the tenant must be on the lease and the caller must
+      be allowed to see that lease, otherwise no row comes back
+    """
+    access_sql, access_params = lease_access_sql(identity, 'lt.lease_id')
     with connection.cursor() as cursor:
-        # First verify the requested tenant is part of the specified lease
-        cursor.execute("""
-            SELECT 1 
-            FROM rentapp_leasetenant lt
-            WHERE lt.tenant_id = %s AND lt.lease_id = %s
-        """, [tenant_id, lease_id])
-        
-        if not cursor.fetchone():
-            return HttpResponseForbidden("Invalid tenant-lease combination")
-
-        if role == 'landlord':
-            # Verify landlord owns the property this lease is for
-            cursor.execute("""
-                SELECT 1
-                FROM rentapp_lease l
-                JOIN rentapp_property p ON l.property_id = p.property_id
-                WHERE l.lease_id = %s AND p.landlord_id = %s
-            """, [lease_id, user.landlord.landlord_id])
-            
-            if not cursor.fetchone():
-                return HttpResponseForbidden("Not your property's lease")
-        else:  # tenant
-            # Verify requesting tenant is also part of this lease
-            cursor.execute("""
-                SELECT 1
-                FROM rentapp_leasetenant lt
-                WHERE lt.lease_id = %s AND lt.tenant_id = %s
-            """, [lease_id, user.tenant.tenant_id])
-            
-            if not cursor.fetchone():
-                return HttpResponseForbidden("Not your lease")
-
-        # Get tenant details
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT u.first_name, u.last_name, u.email, u.phone
-            FROM rentapp_tenant t
+            FROM rentapp_leasetenant lt
+            JOIN rentapp_tenant t ON lt.tenant_id = t.tenant_id
             JOIN rentapp_user u ON t.user_id = u.user_id
-            WHERE t.tenant_id = %s
-        """, [tenant_id])
-        
+            WHERE lt.tenant_id = %s AND lt.lease_id = %s AND {access_sql}
+        """, [tenant_id, lease_id, *access_params])
         row = cursor.fetchone()
-        if not row:
-            return HttpResponseForbidden("Tenant not found")
-
-        tenant_dict = {
-            'user': {
-                'first_name': row[0],
-                'last_name': row[1],
-                'email': row[2],
-                'phone': row[3]
-            }
-        }
 
-    return render(request, 'rentapp/tenant_details.html', {
+    if not row:
+        return HttpResponseForbidden("Not authorized to view this tenant's details")
+
+    tenant_dict = {
+        'user': {
+            'first_name': row[0],
+            'last_name': row[1],
+            'email': row[2],
+            'phone': row[3]
+        }
+    }
+    return {
         'tenant': tenant_dict,
         'lease_id': lease_id
-    })
+    }
 
 @login_required
-def landlord_details(request, landlord_id, property_id):
+async def landlord_details(request, landlord_id, property_id):
     """View landlord details with proper authorization"""
-    user = User.objects.get(user_id=request.session['user_id'])
-    role = request.session.get('role')
-
-    with connection.cursor() as cursor:
-        if role != 'tenant':
-            return HttpResponseForbidden("Only tenants can view landlord details")
+    identity = await aget_identity(request)
+    context = await sync_to_async(get_landlord_details)(identity, landlord_id, property_id)
+    if isinstance(context, HttpResponse):
+        return context
+    return render(request, 'rentapp/landlord_details.html', context)
 
-        # Verify tenant has a lease for a property owned by this landlord
-        cursor.execute("""
-            SELECT 1
-            FROM rentapp_leasetenant lt
-            JOIN rentapp_lease l ON lt.lease_id = l.lease_id
-            JOIN rentapp_property p ON l.property_id = p.property_id
-            WHERE lt.tenant_id = %s 
-            AND p.landlord_id = %s
-            AND p.property_id = %s
-        """, [user.tenant.tenant_id, landlord_id, property_id])
-
-        if not cursor.fetchone():
-            return HttpResponseForbidden("Not authorized to view this landlord's details")
+def get_landlord_details(identity, landlord_id, property_id):
+    """
+    Landlord details template context, or a forbidden response:
+    - Tenants only
+    - One statement: no row unless the caller has a lease on this landlord's property
+    """
+    if identity.role != 'tenant':
+        return HttpResponseForbidden("Only tenants can view landlord details")
 
-        # Get landlord details
+    with connection.cursor() as cursor:
         cursor.execute("""
             SELECT u.first_name, u.last_name, u.email, u.phone
-            FROM rentapp_landlord l
-            JOIN rentapp_user u ON l.user_id = u.user_id
-            WHERE l.landlord_id = %s
-        """, [landlord_id])
-
+            FROM rentapp_landlord ll
+            JOIN rentapp_user u ON ll.user_id = u.user_id
+            WHERE ll.landlord_id = %s
+            AND EXISTS (
+                SELECT 1
+                FROM rentapp_leasetenant lt
+                JOIN rentapp_lease l ON lt.lease_id = l.lease_id
+                JOIN rentapp_property p ON l.property_id = p.property_id
+                WHERE lt.tenant_id = %s
+                AND p.landlord_id = ll.landlord_id
+                AND p.property_id = %s
+            )
+        """, [landlord_id, identity.tenant.tenant_id, property_id])
         row = cursor.fetchone()
-        if not row:
-            return HttpResponseForbidden("Landlord not found")
-
-        landlord_dict = {
-            'user': {
-                'first_name': row[0],
-                'last_name': row[1],
-                'email': row[2],
-                'phone': row[3]
-            }
+
+    if not row:
+        return HttpResponseForbidden("Not authorized to view this landlord's details")
+
+    landlord_dict = {
+        'user': {
+            'first_name': row[0],
+            'last_name': row[1],
+            'email': row[2],
+            'phone': row[3]
         }
+    }
 
-    return render(request, 'rentapp/landlord_details.html', {
+    return {
         'landlord': landlord_dict,
         'property_id': property_id
-    })
+    }
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 from pathlib import Path
 
+from rentre.database import database_from_url, sqlite_database
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -62,22 +64,32 @@ INSTALLED_APPS = [
     'rentapp'
 ]
 
+# Opt-in per-request SQL/template timing: Server-Timing header and a log line per request
+REQUEST_INSTRUMENTATION = os.environ.get('REQUEST_INSTRUMENTATION', 'False') == 'True'
+
 MIDDLEWARE = [
+    # First, so its total covers every other middleware; removes itself when disabled
+    'rentapp.middleware.RequestInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Before sessions and auth, so static hits are answered without touching the database
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'rentapp.middleware.IdentityMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
 ]
 
 ROOT_URLCONF = 'rentre.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': (
+            'rentapp.instrumentation.InstrumentedDjangoTemplates' if REQUEST_INSTRUMENTATION
+            else 'django.template.backends.django.DjangoTemplates'
+        ),
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -93,18 +105,108 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'rentre.wsgi.application'
 
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        # One JSON line per request when REQUEST_INSTRUMENTATION is on
+        'rentapp.requests': {'handlers': ['console'], 'level': 'INFO', 'propagate': False},
+    },
+}
+
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# DATABASE_URL selects PostgreSQL; otherwise the tuned SQLite profile is used
+# (see rentre/database.py)
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+
+# Same switch as gunicorn.conf.py. Under ASGI every request runs in its own
+# thread-sensitive context, so a persistent connection is never reused and each
+# request would leave one open; a per-worker psycopg pool is used instead.
+# DB_POOL_MAX_SIZE x workers must stay below the server's max_connections.
+SERVER_MODE = os.environ.get('SERVER_MODE', 'asgi')
+
+DATABASE_POOL = {
+    'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '2')),
+    'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', '10')),
+    # Seconds a request waits for a free connection before failing
+    'timeout': int(os.environ.get('DB_POOL_TIMEOUT', '10')),
+} if SERVER_MODE == 'asgi' else None
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': (
+        database_from_url(
+            DATABASE_URL, conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', '60')), pool=DATABASE_POOL
+        )
+        if DATABASE_URL
+        else sqlite_database(BASE_DIR / 'db.sqlite3')
+    )
 }
 
 
+# Cache
+# locmem is per process: each gunicorn worker keeps its own entries and version
+# tokens, so cached pages are also keyed by the landlord/tenant revision in the
+# database and a write in one worker is seen by all. "file" or "db" share the
+# entries themselves (run "python manage.py createcachetable" once for "db")
+
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+
+if CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_LOCATION', BASE_DIR / '.cache'),
+        }
+    }
+elif CACHE_BACKEND == 'db':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'rentapp_cache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'rentre',
+        }
+    }
+
+# Sessions
+# "db" reads django_session on every request; "signed_cookies" keeps the small
+# user_id/role payload in the signed cookie itself (no session I/O at all);
+# "cached_db" reads through CACHES and writes through to the database.
+# "python manage.py prune_sessions" (run by build.sh on every deploy; schedule it
+# daily too) runs clearsessions, and under signed_cookies, whose clearsessions
+# does nothing, deletes the django_session rows an earlier backend left behind.
+
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'db')
+
+SESSION_ENGINE = {
+    'db': 'django.contrib.sessions.backends.db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+}[SESSION_BACKEND]
+
+# Also the max age of signed cookie sessions, which cannot be revoked server-side
+SESSION_COOKIE_AGE = int(os.environ.get('SESSION_COOKIE_AGE', str(60 * 60 * 24 * 14)))
+
+# Seconds a cached dashboard/analytics result lives; writes invalidate it sooner
+RENTAPP_CACHE_TIMEOUT = int(os.environ.get('RENTAPP_CACHE_TIMEOUT', '300'))
+
+# Rows per dashboard/analytics page; ?page_size= may ask for up to the max
+RENTAPP_PAGE_SIZE = int(os.environ.get('RENTAPP_PAGE_SIZE', '50'))
+RENTAPP_PAGE_SIZE_MAX = int(os.environ.get('RENTAPP_PAGE_SIZE_MAX', '200'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -123,6 +225,30 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+AUTHENTICATION_BACKENDS = ['rentapp.backends.RentappBackend']
+
+# PBKDF2 work factor for new and upgraded hashes (0 keeps Django's default);
+# existing hashes are rehashed to it on the next successful login
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', '0'))
+
+PASSWORD_HASHERS = [
+    'rentapp.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Login token buckets as 'attempts/seconds', checked before any lookup or hash.
+# 'local' keeps them per process; 'cache' shares them through CACHES.
+LOGIN_THROTTLE_BACKEND = os.environ.get('LOGIN_THROTTLE_BACKEND', 'local')
+LOGIN_THROTTLE_ACCOUNT = os.environ.get('LOGIN_THROTTLE_ACCOUNT', '5/300')
+LOGIN_THROTTLE_IP = os.environ.get('LOGIN_THROTTLE_IP', '30/300')
+# Reverse proxies in front of the app that append to X-Forwarded-For. 0 uses
+# REMOTE_ADDR; opt in (1 on Render) only when exactly that many proxies append,
+# otherwise clients pick their own throttle address by sending the header
+LOGIN_THROTTLE_PROXY_COUNT = int(os.environ.get('LOGIN_THROTTLE_PROXY_COUNT', '0'))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -144,6 +270,17 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 STATICFILES_DIRS = [ BASE_DIR / 'static' ]
 
+# collectstatic (build.sh) writes content-hashed copies plus .gz/.br siblings;
+# WhiteNoise serves the hashed names with a far-future immutable Cache-Control
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
 # Login URL for @login_required decorator
 LOGIN_URL = 'login'
 